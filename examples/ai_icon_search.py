@@ -1,22 +1,19 @@
 """Example: Using AI to search and generate icons."""
 
 import os
-from pathlib import Path
-import sys
-
-# Add src to path for local development
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 from icon_gen_ai import IconGenerator, IconAssistant, check_ai_available
 
+_BANNER = "=" * 70
+
 os.makedirs("output/ai", exist_ok=True)
 
 def main():
     """Demonstrate AI-powered icon search."""
     
-    print("=" * 70)
+    print(_BANNER)
     print("AI-Powered Icon Search Example")
-    print("=" * 70)
+    print(_BANNER)
     
     # Check if AI is available
     if not check_ai_available():
@@ -40,9 +37,9 @@ def main():
         print()
         
         # Example 1: Search for payment icons
-        print("\n" + "=" * 70)
+        print("\n" + _BANNER)
         print("Example 1: Search for payment icons")
-        print("=" * 70)
+        print(_BANNER)
         
         query = "I need icons for a payment checkout page"
         print(f"\nQuery: {query}\n")
@@ -75,9 +72,9 @@ def main():
                 print(f"   ✓ Generated: {result}\n")
         
         # Example 2: Search with context
-        print("\n" + "=" * 70)
+        print("\n" + _BANNER)
         print("Example 2: Search with design context")
-        print("=" * 70)
+        print(_BANNER)
         
         query = "dashboard navigation icons"
         context = {
@@ -113,9 +110,9 @@ def main():
             if result:
                 print(f"   ✓ Generated: {result}\n")
         
-        print("\n" + "=" * 70)
+        print("\n" + _BANNER)
         print("✓ Examples completed! Check the output/ai/ directory")
-        print("=" * 70)
+        print(_BANNER)
         
     except Exception as e:
         print(f"\n✗ Error: {e}")
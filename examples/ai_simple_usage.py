@@ -1,11 +1,8 @@
 """Simple example: AI icon discovery and generation in one script."""
 
 import os
-from pathlib import Path
-import sys
 
-# Add src to path for local development
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+_BANNER = "=" * 70
 
 os.makedirs("output/ai", exist_ok=True)
 
@@ -73,9 +70,9 @@ def with_context_example():
 
 
 if __name__ == "__main__":
-    print("=" * 70)
+    print(_BANNER)
     print("Icon-Gen AI Examples")
-    print("=" * 70)
+    print(_BANNER)
     print("\nChoose an example:")
     print("1. Simple search and generate: Three icons for a settings page")
     print("2. With project context: Four navigation icons for a mobile app in minimal style")
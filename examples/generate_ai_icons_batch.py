@@ -1,12 +1,9 @@
 """Generate AI model icons as a batch"""
-from pathlib import Path
-import sys
-
-# Add src to path for local development
-sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
 from icon_gen_ai.generator import IconGenerator
 
+_BANNER = "=" * 60
+
 
 def main():
     """Generate colored SVG icons for major AI models."""
@@ -33,9 +30,9 @@ def main():
     
 
     
-    print("=" * 60)
+    print(_BANNER)
     print("AI Model Icon Generator")
-    print("=" * 60)
+    print(_BANNER)
     print(f"Output directory: {generator.output_dir.absolute()}")
     print(f"Color: {color}")
     print(f"Size: {size}px")
@@ -46,7 +43,7 @@ def main():
     generated = generator.generate_batch(ai_icons, color=color, size=size, outline_color=color, outline_width=8, border_radius=48)
     
     # Summary
-    print("\n" + "=" * 60)
+    print("\n" + _BANNER)
     print(f"Successfully generated {len(generated)}/{len(ai_icons)} icons:")
     for path in generated:
         print(f"  ✓ {path.name}")
@@ -54,7 +51,7 @@ def main():
     if len(generated) < len(ai_icons):
         print(f"\n⚠ Failed to generate {len(ai_icons) - len(generated)} icon(s)")
     
-    print("=" * 60)
+    print(_BANNER)
 
 
 if __name__ == "__main__":
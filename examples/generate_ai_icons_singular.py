@@ -1,21 +1,18 @@
 """Generate AI model icons with custom backgrounds and gradients (one by one)"""
-from pathlib import Path
-import sys
-
-# Add src to path for local development
-sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
 from icon_gen_ai.generator import IconGenerator
 
+_BANNER = "=" * 70
+
 
 def main():
     """Generate AI icons with custom backgrounds and colors."""
     # Initialize generator
     generator = IconGenerator(output_dir="output")
     
-    print("=" * 70)
+    print(_BANNER)
     print("AI Model Icon Generator - Individual Icon Generation")
-    print("=" * 70)
+    print(_BANNER)
     print(f"Output directory: {generator.output_dir.absolute()}")
     print()
     
@@ -79,9 +76,9 @@ def main():
         print(f"  ✓ {result.name}")
     
     # Summary
-    print("\n" + "=" * 70)
+    print("\n" + _BANNER)
     print(f"✓ Successfully generated {len(generated)}/4 icons")
-    print("=" * 70)
+    print(_BANNER)
 
 
 if __name__ == "__main__":
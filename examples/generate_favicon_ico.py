@@ -1,12 +1,4 @@
 """Generate a favicon ICO from an Iconify icon."""
-
-from pathlib import Path
-import sys
-
-# Add project root to path for local development
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(PROJECT_ROOT / "src"))
-
 from icon_gen_ai.generator import IconGenerator
 
 
@@ -1,9 +1,4 @@
 """Generate feature icons"""
-from pathlib import Path
-import sys
-
-# Add src to path for local development
-sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
 from icon_gen_ai.generator import IconGenerator
 
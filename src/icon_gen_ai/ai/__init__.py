@@ -1,5 +1,7 @@
 """AI-powered icon discovery and generation."""
 
+from functools import lru_cache
+
 from .base import BaseLLMProvider, IconSuggestion, LLMResponse
 from .assistant import IconAssistant
 
@@ -28,9 +30,13 @@ def is_ai_available() -> bool:
     return OPENAI_AVAILABLE or ANTHROPIC_AVAILABLE or HUGGINGFACE_AVAILABLE
 
 
+@lru_cache(maxsize=1)
 def get_available_providers() -> list:
     """Get list of available LLM providers.
-    
+
+    The availability flags are fixed at import time, so the probe is
+    computed once and cached for repeated CLI/assistant calls.
+
     Returns:
         List of provider names that have their required packages installed
     """
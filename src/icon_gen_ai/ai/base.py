@@ -1,11 +1,15 @@
 """Abstract base class for LLM providers."""
 
+import re
 from abc import ABC, abstractmethod
 from typing import Optional, List, Dict, Any
 from dataclasses import dataclass
 
+# Icon identifiers like "mdi:icon-name" or "simple-icons:name".
+_ICON_NAME_RE = re.compile(r'([a-z0-9-]+:[a-z0-9-]+)')
 
-@dataclass
+
+@dataclass(slots=True)
 class IconSuggestion:
     """Represents a suggested icon from the LLM."""
     
@@ -16,7 +20,7 @@ class IconSuggestion:
     style_suggestions: Optional[Dict[str, Any]] = None  # color, size, bg_color, etc.
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMResponse:
     """Represents the complete response from an LLM."""
     
@@ -120,9 +124,7 @@ class BaseLLMProvider(ABC):
         suggestions = []
         
         # Look for patterns like "mdi:icon-name" or "simple-icons:name"
-        import re
-        pattern = r'([a-z0-9-]+:[a-z0-9-]+)'
-        matches = re.findall(pattern, llm_text.lower())
+        matches = _ICON_NAME_RE.findall(llm_text.lower())
         
         for match in matches:
             suggestions.append(IconSuggestion(
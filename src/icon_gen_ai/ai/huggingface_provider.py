@@ -1,6 +1,12 @@
 """HuggingFace Inference API provider implementation."""
 
+import asyncio
+import hashlib
 import json
+import logging
+import re
+import time
+from functools import lru_cache
 from typing import Optional, Dict, Any
 
 try:
@@ -9,8 +15,114 @@ try:
 except ImportError:
     HUGGINGFACE_AVAILABLE = False
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .base import BaseLLMProvider, LLMResponse, IconSuggestion
 
+log = logging.getLogger(__name__)
+
+# Responses run up to ~10k tokens of JSON; orjson parses them several times
+# faster than stdlib json when it's installed. Its JSONDecodeError subclasses
+# json.JSONDecodeError, so the except clauses below work with either.
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+else:
+    _loads = json.loads
+
+    def _dumps(obj) -> str:
+        return json.dumps(obj, indent=2)
+
+# raw_decode() parses a leading JSON document and ignores whatever follows,
+# which rescues the common "valid JSON + trailing prose" responses without
+# paying for the character-level repair scan.
+_DECODER = json.JSONDecoder()
+
+# Structural JSON tokens for the repair scan: escape sequences are consumed
+# as single tokens so a matched quote is never an escaped one.
+_JSON_STRUCTURAL_RE = re.compile(r'\\.|["{}]', re.DOTALL)
+
+# One client per (api_key, base_url) so repeated provider construction reuses
+# the underlying HTTP session instead of paying DNS/TLS setup per instance.
+# The client class is part of the key so a patched class gets fresh clients.
+_CLIENT_CACHE: Dict[tuple, Any] = {}
+
+
+# Retry policy for the API call: 3 attempts with exponential backoff on
+# transient failures (rate limits, gateway errors, timeouts).
+_MAX_ATTEMPTS = 3
+_BACKOFF_SECONDS = 0.5
+_TRANSIENT_STATUS = (429, 500, 502, 503, 504)
+_REQUEST_TIMEOUT = 60
+
+
+# Server-side KV/prefix caching only kicks in for byte-identical prompt
+# prefixes, so the JSON instruction is a fixed suffix and the combined
+# system prompt is memoized: every call with the same system prompt sends
+# exactly the same bytes. Request-specific context stays in the user
+# message, after the stable prefix.
+_JSON_SYSTEM_SUFFIX = "\n\nIMPORTANT: Respond ONLY with valid JSON, no additional text or markdown formatting."
+
+
+@lru_cache(maxsize=8)
+def _enhanced_system(system_prompt: str) -> str:
+    return system_prompt + _JSON_SYSTEM_SUFFIX
+
+
+# Decode cost scales with max_tokens, so when the prompt states how many
+# suggestions it wants ("give me 5 icons"), size the budget to that count
+# (~450 tokens per suggestion plus headroom for explanation/search_query)
+# instead of always paying for the 25-suggestion worst case.
+_COUNT_RE = re.compile(r'\b(?:suggest|need|give|want|top)\s*(\d{1,2})\b|\b(\d{1,2})\s+icons?\b', re.I)
+_DEFAULT_MAX_TOKENS = 10000  # ~400 tokens per suggestion × 25
+
+
+def _max_tokens_for(user_prompt: str) -> int:
+    m = _COUNT_RE.search(user_prompt)
+    if not m:
+        return _DEFAULT_MAX_TOKENS
+    count = int(next(g for g in m.groups() if g))
+    if count <= 0:
+        return _DEFAULT_MAX_TOKENS
+    return min(_DEFAULT_MAX_TOKENS, 450 * count + 300)
+
+
+def _is_transient(exc: Exception) -> bool:
+    """True for errors worth retrying: timeouts and retryable HTTP statuses."""
+    if isinstance(exc, (TimeoutError, asyncio.TimeoutError)):
+        return True
+    status = getattr(getattr(exc, "response", None), "status_code", None)
+    return status in _TRANSIENT_STATUS
+
+
+def _get_client(api_key: str, base_url: Optional[str]):
+    key = (InferenceClient, api_key, base_url)
+    client = _CLIENT_CACHE.get(key)
+    if client is None:
+        if len(_CLIENT_CACHE) >= 8:
+            _CLIENT_CACHE.clear()
+        client = InferenceClient(api_key=api_key, base_url=base_url, timeout=_REQUEST_TIMEOUT)
+        _CLIENT_CACHE[key] = client
+    return client
+
+
+def _get_aclient(api_key: str, base_url: Optional[str]):
+    from huggingface_hub import AsyncInferenceClient
+
+    key = (AsyncInferenceClient, api_key, base_url)
+    client = _CLIENT_CACHE.get(key)
+    if client is None:
+        if len(_CLIENT_CACHE) >= 8:
+            _CLIENT_CACHE.clear()
+        client = AsyncInferenceClient(api_key=api_key, base_url=base_url, timeout=_REQUEST_TIMEOUT)
+        _CLIENT_CACHE[key] = client
+    return client
+
 
 class HuggingFaceProvider(BaseLLMProvider):
     """HuggingFace Inference API provider for icon suggestions."""
@@ -40,10 +152,17 @@ class HuggingFaceProvider(BaseLLMProvider):
         super().__init__(api_key, base_url, model, max_tokens, temperature)
         
         # Initialize HuggingFace client
-        self.client = InferenceClient(
-            api_key=self.api_key,
-            base_url=self.base_url if self.base_url else None
+        self.client = _get_client(
+            self.api_key,
+            self.base_url if self.base_url else None
         )
+
+        # Async client created lazily by aquery() on first use.
+        self.aclient = None
+
+        # Exact-match response cache: repeated prompts skip the API call
+        # (and the seconds-long decode) entirely for this provider instance.
+        self._response_cache: Dict[str, LLMResponse] = {}
     
     def get_default_model(self) -> str:
         """Return the default HuggingFace model."""
@@ -83,78 +202,185 @@ class HuggingFaceProvider(BaseLLMProvider):
         Raises:
             Exception: If API call fails
         """
+        cache_key = hashlib.blake2b(
+            json.dumps(
+                [self.model, self.temperature, system_prompt, user_prompt, context],
+                sort_keys=True,
+            ).encode("utf-8")
+        ).hexdigest()
+        cached = self._response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            # Build user message
-            user_message = user_prompt
-            if context:
-                user_message += f"\n\nAdditional context: {json.dumps(context, indent=2)}"
-            
-            # Add JSON format instruction to system prompt
-            enhanced_system = system_prompt + "\n\nIMPORTANT: Respond ONLY with valid JSON, no additional text or markdown formatting."
-            
-            # Make API call with sufficient tokens for up to 25 suggestions
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": enhanced_system},
-                    {"role": "user", "content": user_message}
-                ],
-                max_tokens=10000,  # ~400 tokens per suggestion × 25 = 10,000
-                temperature=self.temperature
-            )
-            
-            # Extract response text
-            response_text = response.choices[0].message.content
-            
-            # Strip markdown code fences if present
-            response_text = response_text.strip()
-            if response_text.startswith('```'):
-                # Find the end of the first line (```json or just ```)
-                first_newline = response_text.find('\n')
-                if first_newline > 0:
-                    response_text = response_text[first_newline + 1:]
-                
-                # Remove trailing ```
-                if response_text.rstrip().endswith('```'):
-                    response_text = response_text.rstrip()[:-3].rstrip()
-            
-            # Parse JSON response with fallback for incomplete JSON
+            messages = self._build_messages(user_prompt, system_prompt, context)
+
+            # Make the API call with a token budget sized to the request,
+            # retrying transient failures with exponential backoff.
+            for attempt in range(_MAX_ATTEMPTS):
+                try:
+                    response = self.client.chat.completions.create(
+                        model=self.model,
+                        messages=messages,
+                        max_tokens=_max_tokens_for(user_prompt),
+                        temperature=self.temperature
+                    )
+                    break
+                except Exception as e:
+                    if attempt == _MAX_ATTEMPTS - 1 or not _is_transient(e):
+                        raise
+                    time.sleep(_BACKOFF_SECONDS * (2 ** attempt))
+
+            result = self._parse_response(response, user_prompt)
+
+            if len(self._response_cache) >= 128:
+                self._response_cache.clear()
+            self._response_cache[cache_key] = result
+            return result
+
+        except Exception as e:
+            log.error("Error querying HuggingFace: %s", e)
+            raise
+
+    async def aquery(
+        self,
+        user_prompt: str,
+        system_prompt: str,
+        context: Optional[Dict[str, Any]] = None
+    ) -> LLMResponse:
+        """Async variant of query() using AsyncInferenceClient.
+
+        Shares message building, response parsing and the response cache
+        with the sync path, so behavior is identical apart from not
+        blocking the event loop during the API round-trip.
+        """
+        cache_key = hashlib.blake2b(
+            json.dumps(
+                [self.model, self.temperature, system_prompt, user_prompt, context],
+                sort_keys=True,
+            ).encode("utf-8")
+        ).hexdigest()
+        cached = self._response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            if self.aclient is None:
+                self.aclient = _get_aclient(
+                    self.api_key,
+                    self.base_url if self.base_url else None
+                )
+
+            messages = self._build_messages(user_prompt, system_prompt, context)
+
+            for attempt in range(_MAX_ATTEMPTS):
+                try:
+                    response = await self.aclient.chat.completions.create(
+                        model=self.model,
+                        messages=messages,
+                        max_tokens=_max_tokens_for(user_prompt),
+                        temperature=self.temperature
+                    )
+                    break
+                except Exception as e:
+                    if attempt == _MAX_ATTEMPTS - 1 or not _is_transient(e):
+                        raise
+                    await asyncio.sleep(_BACKOFF_SECONDS * (2 ** attempt))
+
+            result = self._parse_response(response, user_prompt)
+
+            if len(self._response_cache) >= 128:
+                self._response_cache.clear()
+            self._response_cache[cache_key] = result
+            return result
+
+        except Exception as e:
+            log.error("Error querying HuggingFace: %s", e)
+            raise
+
+    async def query_many(
+        self,
+        user_prompts: list,
+        system_prompt: str,
+        context: Optional[Dict[str, Any]] = None
+    ) -> list:
+        """Run several prompts concurrently and return their responses in order."""
+        return await asyncio.gather(
+            *(self.aquery(p, system_prompt, context=context) for p in user_prompts)
+        )
+
+    def _build_messages(
+        self,
+        user_prompt: str,
+        system_prompt: str,
+        context: Optional[Dict[str, Any]] = None
+    ) -> list:
+        """Build the chat messages shared by the sync and async paths."""
+        user_message = user_prompt
+        if context:
+            user_message += f"\n\nAdditional context: {_dumps(context)}"
+
+        return [
+            {"role": "system", "content": _enhanced_system(system_prompt)},
+            {"role": "user", "content": user_message}
+        ]
+
+    def _parse_response(self, response, user_prompt: str) -> LLMResponse:
+        """Turn a raw completion into an LLMResponse (shared sync/async)."""
+        # Extract response text
+        response_text = response.choices[0].message.content
+
+        # Strip markdown code fences if present
+        response_text = response_text.strip()
+        if response_text.startswith('```'):
+            # Find the end of the first line (```json or just ```)
+            first_newline = response_text.find('\n')
+            if first_newline > 0:
+                response_text = response_text[first_newline + 1:]
+
+            # Remove trailing ```
+            if response_text.rstrip().endswith('```'):
+                response_text = response_text.rstrip()[:-3].rstrip()
+
+        # Parse JSON response with fallback for incomplete JSON
+        try:
+            response_json = _loads(response_text)
+        except json.JSONDecodeError as e:
+            # Diagnostics are opt-in via logging so the hot path never
+            # pays for synchronous stdout writes.
+            log.debug("JSON parsing failed: %s", e)
+            log.debug("Response text (first 200 chars): %s", response_text[:200])
+            log.debug("Response text (last 200 chars): %s", response_text[-200:])
+
+            # A complete JSON document followed by trailing commentary
+            # parses fine with raw_decode; only true truncations need the
+            # full repair scan.
             try:
-                response_json = json.loads(response_text)
-            except json.JSONDecodeError as e:
-                # Print debug info
-                print(f"JSON parsing failed: {e}")
-                print(f"Response text (first 200 chars): {response_text[:200]}")
-                print(f"Response text (last 200 chars): {response_text[-200:]}")
-                
+                response_json, _ = _DECODER.raw_decode(response_text)
+            except json.JSONDecodeError:
                 # Try to fix incomplete JSON by finding the last complete object
                 response_json = self._repair_json(response_text)
-            
-            # Build suggestions
-            suggestions = []
-            for suggestion_data in response_json.get("suggestions", []):
-                suggestion = IconSuggestion(
-                    icon_name=suggestion_data.get("icon_name", ""),
-                    reason=suggestion_data.get("reason", ""),
-                    use_case=suggestion_data.get("use_case", ""),
-                    confidence=float(suggestion_data.get("confidence", 1.0)),
-                    style_suggestions=suggestion_data.get("style_suggestions")
-                )
-                suggestions.append(suggestion)
-            
-            # Return structured response
-            return LLMResponse(
-                suggestions=suggestions,
-                explanation=response_json.get("explanation", ""),
-                search_query=response_json.get("search_query", user_prompt),
-                tokens_used=getattr(response.usage, "total_tokens", 0) if hasattr(response, "usage") else 0,
-                provider=self.get_provider_name()
+
+        # Build suggestions
+        suggestions = [
+            IconSuggestion(
+                icon_name=suggestion_data.get("icon_name", ""),
+                reason=suggestion_data.get("reason", ""),
+                use_case=suggestion_data.get("use_case", ""),
+                confidence=float(suggestion_data.get("confidence", 1.0)),
+                style_suggestions=suggestion_data.get("style_suggestions")
             )
-            
-        except Exception as e:
-            print(f"Error querying HuggingFace: {e}")
-            raise
-    
+            for suggestion_data in response_json.get("suggestions", ())
+        ]
+
+        return LLMResponse(
+            suggestions=suggestions,
+            explanation=response_json.get("explanation", ""),
+            search_query=response_json.get("search_query", user_prompt),
+            tokens_used=getattr(response.usage, "total_tokens", 0) if hasattr(response, "usage") else 0,
+            provider=self.get_provider_name()
+        )
+
     def _repair_json(self, text: str) -> Dict[str, Any]:
         """Attempt to repair truncated/incomplete JSON.
         
@@ -168,7 +394,7 @@ class HuggingFaceProvider(BaseLLMProvider):
         
         # Check if response is completely empty or not JSON at all
         if not text or not text.strip().startswith('{'):
-            print(f"ERROR: Response doesn't look like JSON. Full text:\n{text}")
+            log.debug("Response doesn't look like JSON. Full text:\n%s", text)
             raise json.JSONDecodeError(
                 "Response is not valid JSON format",
                 text,
@@ -178,7 +404,7 @@ class HuggingFaceProvider(BaseLLMProvider):
         # Find the position of the suggestions array start
         suggestions_start = text.find('"suggestions"')
         if suggestions_start == -1:
-            print(f"ERROR: No 'suggestions' field found in response")
+            log.debug("No 'suggestions' field found in response")
             raise json.JSONDecodeError(
                 "No suggestions array found in response",
                 text,
@@ -194,41 +420,28 @@ class HuggingFaceProvider(BaseLLMProvider):
                 0
             )
         
-        # Find the last complete suggestion object by looking for '},' or '}]'
-        # Work backwards from the end to find the last complete suggestion
+        # Find the end of the last complete suggestion object. A single
+        # forward pass over the structural tokens ({, }, unescaped quotes)
+        # keeps the Python-level work proportional to the token count
+        # instead of visiting every character of a potentially 40KB payload.
         last_complete_suggestion = -1
-        brace_count = 0
+        depth = 0
         in_string = False
-        escape_next = False
-        
-        for i in range(len(text) - 1, array_start, -1):
-            char = text[i]
-            
-            if escape_next:
-                escape_next = False
-                continue
-            
-            if char == '\\':
-                escape_next = True
+
+        for m in _JSON_STRUCTURAL_RE.finditer(text, array_start + 1):
+            token = m.group()
+            if token[0] == '\\':
                 continue
-            
-            if char == '"' and (i == 0 or text[i-1] != '\\'):
+            if token == '"':
                 in_string = not in_string
-                continue
-            
-            if in_string:
-                continue
-            
-            if char == '}':
-                brace_count += 1
-                if brace_count == 1:
-                    # Found a closing brace for a suggestion
-                    last_complete_suggestion = i + 1
-            elif char == '{':
-                brace_count -= 1
-                if brace_count == 0 and last_complete_suggestion > 0:
-                    # Found the opening brace matching our last complete suggestion
-                    break
+            elif not in_string:
+                if token == '{':
+                    depth += 1
+                elif token == '}':
+                    depth -= 1
+                    if depth == 0:
+                        # Closing brace of a complete top-level suggestion
+                        last_complete_suggestion = m.end()
         
         # If we found a complete suggestion, truncate and close the JSON
         if last_complete_suggestion > 0:
@@ -241,13 +454,13 @@ class HuggingFaceProvider(BaseLLMProvider):
                 else:
                     truncated = text[:last_complete_suggestion] + ']}'
                 
-                partial = json.loads(truncated)
-                
+                partial = _loads(truncated)
+
                 # Ensure suggestions array exists
                 if "suggestions" not in partial:
                     partial["suggestions"] = []
                 
-                print("Warning: Truncated response from HuggingFace, recovered partial data")
+                log.warning("Truncated response from HuggingFace, recovered partial data")
                 return partial
             except json.JSONDecodeError:
                 pass
@@ -264,7 +477,7 @@ class HuggingFaceProvider(BaseLLMProvider):
             open_brackets = truncated.count('[') - truncated.count(']')
             
             truncated += ']' * max(1, open_brackets) + '}' * max(1, open_braces)
-            partial = json.loads(truncated)
+            partial = _loads(truncated)
             return partial
         except json.JSONDecodeError:
             pass
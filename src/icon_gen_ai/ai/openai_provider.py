@@ -9,8 +9,19 @@ try:
 except ImportError:
     OPENAI_AVAILABLE = False
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .base import BaseLLMProvider, LLMResponse, IconSuggestion
 
+# Same optional speedup as the HuggingFace provider: orjson decodes the
+# multi-KB suggestion payloads several times faster when installed, and its
+# JSONDecodeError subclasses json.JSONDecodeError so except clauses keep
+# working with either backend.
+_loads = orjson.loads if orjson is not None else json.loads
+
 
 class OpenAIProvider(BaseLLMProvider):
     """OpenAI API provider for icon suggestions."""
@@ -112,7 +123,7 @@ class OpenAIProvider(BaseLLMProvider):
             
             # Parse JSON response
             try:
-                data = json.loads(content)
+                data = _loads(content)
             except json.JSONDecodeError:
                 # Fallback to text parsing if JSON fails
                 return self._parse_text_response(content, tokens_used)
@@ -1,5 +1,7 @@
 """System prompts for icon discovery and suggestions."""
 
+import re
+
 ICON_DISCOVERY_SYSTEM_PROMPT = """You are an expert icon designer and UI/UX consultant helping users find the perfect icons from Iconify.
 
 Iconify has 275,000+ icons from various collections including:
@@ -66,6 +68,10 @@ USE_CASE_EXAMPLES = {
     "media": "mdi:play, mdi:pause, mdi:music, fa6-solid:image",
 }
 
+# One precompiled alternation over the use-case keys: a single pass over the
+# query replaces N substring scans (and the per-iteration lowering of it).
+_USE_CASE_RE = re.compile('|'.join(re.escape(key) for key in USE_CASE_EXAMPLES), re.I)
+
 STYLE_RECOMMENDATIONS = {
     "modern": {
         "collections": ["heroicons", "lucide", "tabler"],
@@ -107,10 +113,11 @@ def get_enhanced_prompt(user_query: str, context: dict = None) -> str:
         base_prompt += "\n"
     
     # Add relevant examples
-    for use_case, examples in USE_CASE_EXAMPLES.items():
-        if use_case.lower() in user_query.lower():
-            base_prompt += f"Relevant examples for {use_case}: {examples}\n\n"
-    
+    matched = {m.group(0).lower() for m in _USE_CASE_RE.finditer(user_query)}
+    for use_case in USE_CASE_EXAMPLES:
+        if use_case in matched:
+            base_prompt += f"Relevant examples for {use_case}: {USE_CASE_EXAMPLES[use_case]}\n\n"
+
     return base_prompt
 
 def get_style_recommendations(style: str) -> dict:
@@ -2,6 +2,6 @@
 
 Export `Animator` for external use.
 """
-from .animator import Animator
+from .animator import Animator, default_animator
 
-__all__ = ["Animator"]
+__all__ = ["Animator", "default_animator"]
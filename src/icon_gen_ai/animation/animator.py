@@ -14,28 +14,99 @@ No external dependencies required for pure SVG insertion.
 """
 from __future__ import annotations
 
+import copy
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from typing import Optional, Union, Tuple
 from xml.etree import ElementTree as ET
 
 SVG_NS = "http://www.w3.org/2000/svg"
 ET.register_namespace('', SVG_NS)
 
-
+# Default durations per preset (seconds unless specified).
+_DEFAULT_DURS = {
+    'spin': '4s',
+    'pulse': '1.5s',
+    'flip-h': '1s',
+    'flip-v': '1s'
+}
+
+# Every preset apply() understands; anything else is a no-op.
+_KNOWN_PRESETS = frozenset(_DEFAULT_DURS)
+
+# Bare number with optional ms/s unit, e.g. '2', '1.5s', '250ms'.
+_DUR_RE = re.compile(r'^\d+(?:\.\d+)?(ms|s)?$')
+
+# Fast-path helpers: for the common "single plain <g> wrapper" shape, a spin
+# animation is just one element spliced before the closing </g>, with no
+# parse/serialize round-trip at all.
+_VIEWBOX_RE = re.compile(r'viewBox="([^"]+)"')
+_GROUP_OPEN_RE = re.compile(r'<g[\s>]')
+_SPIN_TEMPLATE = (
+    '<animateTransform attributeName="transform" attributeType="XML" '
+    'type="rotate" from="0 {cx} {cy}" to="360 {cx} {cy}" dur="{dur}" '
+    'repeatCount="indefinite" calcMode="linear" />'
+)
+
+# Flip timing is fixed relative to the cycle: stay (4x), flip (1x), stay
+# (4x), flip (1x), so the total is always 10 flip-durations and the
+# normalized keyTimes are constants.
+_FLIP_KEYTIMES = '0.000000;0.400000;0.450000;0.500000;0.900000;0.950000;1.000000'
+_FLIP_KEYSPLINES = ';'.join(['0.42 0 0.58 1'] * 6)
+
+# Attributes shared by every preset's <animateTransform>.
+_ANIM_COMMON = {
+    'attributeName': 'transform',
+    'attributeType': 'XML',
+    'repeatCount': 'indefinite',
+}
+
+
+def _animate_transform(attrs: dict) -> ET.Element:
+    """Build an <animateTransform> element, merging in the shared attributes."""
+    merged = dict(_ANIM_COMMON)
+    merged.update(attrs)
+    return ET.Element(f'{{{SVG_NS}}}animateTransform', merged)
+
+# Parsed-tree cache: bulk animation runs feed the same icon markup through
+# apply() repeatedly, so each distinct input is parsed once and callers get
+# a deepcopy to mutate. Bounded and cleared wholesale when full.
+_TREE_CACHE: dict[str, ET.Element] = {}
+
+
+def _parse_cached(svg_content: str) -> ET.Element:
+    """Parse SVG content, reusing the cached tree for repeated inputs."""
+    base = _TREE_CACHE.get(svg_content)
+    if base is None:
+        base = ET.fromstring(svg_content)
+        if len(_TREE_CACHE) >= 64:
+            _TREE_CACHE.clear()
+        _TREE_CACHE[svg_content] = base
+    return copy.deepcopy(base)
+
+
+@lru_cache(maxsize=128)
 def _parse_duration_part(part: Optional[str]) -> Optional[str]:
-    """Normalize a duration part like '2s' or '500ms' or '2' -> '2s'."""
+    """Normalize a duration part like '2s' or '500ms' or '2' -> '2s'.
+
+    The same handful of duration strings recurs across a batch, so the
+    normalization is memoized like `_center`.
+    """
     if not part:
         return None
     p = part.strip()
+    m = _DUR_RE.match(p)
+    if m:
+        # Bare numbers are assumed to be seconds
+        return p if m.group(1) else p + 's'
     if p.endswith('ms') or p.endswith('s'):
         return p
-    # If numeric, assume seconds
-    try:
-        float(p)
-        return p + 's'
-    except Exception:
-        return None
+    return None
 
 
+@lru_cache(maxsize=128)
 def _dur_to_seconds(dur: str) -> float:
     """Convert a duration string like '1.5s' or '250ms' to seconds (float)."""
     s = dur.strip()
@@ -50,6 +121,27 @@ def _dur_to_seconds(dur: str) -> float:
         return 1.0
 
 
+@lru_cache(maxsize=256)
+def _center(
+    vb: Optional[str], width: Optional[str], height: Optional[str]
+) -> Tuple[Optional[float], Optional[float]]:
+    """Compute the rotation/scale origin from viewBox or width/height.
+
+    Icons in a batch overwhelmingly share the same handful of viewBox
+    strings, so the split/float work is cached on the raw attribute values.
+    """
+    if vb:
+        try:
+            x, y, w, h = map(float, vb.split())
+            return x + w / 2, y + h / 2
+        except Exception:
+            return None, None
+    try:
+        return float(width or '24') / 2, float(height or '24') / 2
+    except Exception:
+        return None, None
+
+
 class Animator:
     """Apply small SVG animations to an icon's SVG string.
 
@@ -90,40 +182,25 @@ class Animator:
 
         anim_type = (anim_type or '').strip().lower()
 
-        # Default durations
-        defaults = {
-            'spin': '4s',
-            'pulse': '1.5s',
-            'flip-h': '1s',
-            'flip-v': '1s'
-        }
+        # Unknown presets are a no-op; bail before paying for the parse.
+        if anim_type not in _KNOWN_PRESETS:
+            return svg_content
+
+        dur = dur_part or _DEFAULT_DURS[anim_type]
 
-        dur = dur_part or defaults.get(anim_type, '2s')
+        if anim_type == 'spin':
+            fast = self._apply_spin_fast(svg_content, dur)
+            if fast is not None:
+                return fast
 
         try:
-            root = ET.fromstring(svg_content)
+            root = _parse_cached(svg_content)
         except ET.ParseError:
             # Return original if invalid XML
             return svg_content
 
         # Determine viewBox center for rotation origin
-        vb = root.get('viewBox')
-        if vb:
-            parts = vb.split()
-            try:
-                x, y, w, h = map(float, parts)
-                cx = x + w / 2
-                cy = y + h / 2
-            except Exception:
-                cx = cy = None
-        else:
-            try:
-                w = float(root.get('width', '24'))
-                h = float(root.get('height', '24'))
-                cx = w / 2
-                cy = h / 2
-            except Exception:
-                cx = cy = None
+        cx, cy = _center(root.get('viewBox'), root.get('width'), root.get('height'))
 
         # Find or create target group to attach animation
         ns = SVG_NS
@@ -146,8 +223,19 @@ class Animator:
             # No children — nothing to animate
             return svg_content
 
-        # If the target is not a group, wrap the visual children into a new <g>
-        if target.tag != tag_g:
+        # If the target is not a group, wrap the visual children into a new <g>.
+        # Exception: spin only appends one animateTransform, and SMIL applies
+        # that to whatever element hosts it — so a single plain visual child
+        # can be animated directly, skipping the rebuild.
+        visual_children = [c for c in root if c.tag != f'{{{ns}}}defs']
+        if (
+            anim_type == 'spin'
+            and target.tag != tag_g
+            and len(visual_children) == 1
+            and not target.get('transform')
+        ):
+            pass
+        elif target.tag != tag_g:
             new_group = ET.Element(tag_g)
             # move visual children (skip defs)
             for child in list(root):
@@ -185,14 +273,11 @@ class Animator:
                 target.attrib.pop('transform', None)
                 target.append(inner_group)
             
-            anim_el = ET.Element(f'{{{ns}}}animateTransform', {
-                'attributeName': 'transform',
-                'attributeType': 'XML',
+            anim_el = _animate_transform({
                 'type': 'rotate',
                 'from': f'0 {cx} {cy}',
                 'to': f'360 {cx} {cy}',
                 'dur': dur,
-                'repeatCount': 'indefinite',
                 'calcMode': 'linear'
             })
 
@@ -234,14 +319,11 @@ class Animator:
             anim_group.set('transform-box', 'view-box')
             anim_group.set('transform-origin', f'{cx}px {cy}px')
 
-            anim_el = ET.Element(f'{{{ns}}}animateTransform', {
-                'attributeName': 'transform',
-                'attributeType': 'XML',
+            anim_el = _animate_transform({
                 'type': 'scale',
                 'values': '1 1;0.1 0.1;1 1',
                 'keyTimes': '0;0.5;1',
                 'dur': dur,
-                'repeatCount': 'indefinite',
                 'calcMode': 'spline',
                 'keySplines': '0.42 0 0.58 1;0.42 0 0.58 1'
             })
@@ -251,8 +333,6 @@ class Animator:
         elif anim_type in ('flip-h', 'flip-v'):
             # flip with asymmetric timing: stay 4x longer than flip
             flip_dur_seconds = _dur_to_seconds(dur)
-            stay_seconds = flip_dur_seconds * 4
-            total = stay_seconds + flip_dur_seconds + stay_seconds + flip_dur_seconds
 
             # Build transform values for center-based flips
             if cx is None or cy is None:
@@ -294,43 +374,83 @@ class Animator:
             anim_group.set('transform-box', 'view-box')
             anim_group.set('transform-origin', f'{cx}px {cy}px')
 
-            # keyTimes normalized for two quick flips within the cycle
-            # pattern: original (4x) -> quick flip to inverted and back within 1x -> original (4x) -> quick flip (1x)
-            t0 = 0.0
-            t1 = stay_seconds / total                      # end of first long stay (4x)
-            t2 = (stay_seconds + flip_dur_seconds * 0.5) / total  # midpoint of first quick flip
-            t3 = (stay_seconds + flip_dur_seconds) / total  # end of first quick flip
-            t4 = (stay_seconds + flip_dur_seconds + stay_seconds) / total  # start of second quick flip period (after second long stay)
-            t5 = (stay_seconds + flip_dur_seconds + stay_seconds + flip_dur_seconds * 0.5) / total  # midpoint of second quick flip
-            t6 = 1.0
-            keyTimes = f'{t0:.6f};{t1:.6f};{t2:.6f};{t3:.6f};{t4:.6f};{t5:.6f};{t6:.6f}'
-
             # Build scale values: stay original, quick inverted pulse, back to original, stay, quick inverted pulse, back
             if anim_type == 'flip-h':
                 values = '1 1;1 1;-1 1;1 1;1 1;-1 1;1 1'
             else:
                 values = '1 1;1 1;1 -1;1 1;1 1;1 -1;1 1'
 
-            anim_el = ET.Element(f'{{{ns}}}animateTransform', {
-                'attributeName': 'transform',
-                'attributeType': 'XML',
+            anim_el = _animate_transform({
                 'type': 'scale',
                 'values': values,
-                'keyTimes': keyTimes,
-                'dur': f'{total:.3f}s',
-                'repeatCount': 'indefinite',
+                'keyTimes': _FLIP_KEYTIMES,
+                'dur': f'{flip_dur_seconds * 10:.3f}s',
                 'calcMode': 'spline',
-                'keySplines': '0.42 0 0.58 1;0.42 0 0.58 1;0.42 0 0.58 1;0.42 0 0.58 1;0.42 0 0.58 1;0.42 0 0.58 1'
+                'keySplines': _FLIP_KEYSPLINES
             })
             anim_group.append(anim_el)
             anim_el = None
 
-        else:
-            # Unknown preset — return original
-            return svg_content
-
         # Append animation element to the target group
         if anim_el is not None:
             target.append(anim_el)
 
         return ET.tostring(root, encoding='unicode')
+
+    def apply_many(
+        self,
+        svgs: list[str],
+        spec: Union[str, dict, None],
+        workers: Optional[int] = None,
+    ) -> list[str]:
+        """Apply one animation spec to many SVGs, in input order.
+
+        Large batches are spread over a process pool: ElementTree holds the
+        GIL during parse/serialize, so threads would not overlap the work.
+        Small batches (or a single worker) run serially to avoid the
+        process startup cost. The Animator carries no state, so pickling
+        the bound method is cheap.
+        """
+        workers = workers or os.cpu_count() or 1
+        if workers <= 1 or len(svgs) < 8:
+            return [self.apply(svg, spec) for svg in svgs]
+
+        chunksize = max(1, len(svgs) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(partial(self.apply, spec=spec), svgs, chunksize=chunksize))
+
+    def _apply_spin_fast(self, svg_content: str, dur: str) -> Optional[str]:
+        """Splice a spin animation into markup with one plain <g> wrapper.
+
+        Returns the animated SVG string, or None when the content doesn't
+        match the simple shape (no group, several groups, a transform on
+        the group, defs, or a missing viewBox) so apply() can fall back to
+        the full tree edit.
+        """
+        if len(_GROUP_OPEN_RE.findall(svg_content)) != 1 or svg_content.count('</g>') != 1:
+            return None
+        if '<defs' in svg_content or '<animate' in svg_content or 'transform' in svg_content:
+            return None
+
+        head, sep, _ = svg_content.partition('>')
+        if not sep:
+            return None
+        vb_match = _VIEWBOX_RE.search(head)
+        if not vb_match:
+            return None
+        try:
+            x, y, w, h = map(float, vb_match.group(1).split())
+        except ValueError:
+            return None
+
+        cx = x + w / 2
+        cy = y + h / 2
+        fragment = _SPIN_TEMPLATE.format(cx=cx, cy=cy, dur=dur)
+        before, closer, after = svg_content.rpartition('</g>')
+        return before + fragment + closer + after
+
+
+# Animator carries no per-instance state (presets and caches live at module
+# scope), so callers can share this flyweight instead of constructing one
+# per icon.
+default_animator = Animator()
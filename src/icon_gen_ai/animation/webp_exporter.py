@@ -4,6 +4,10 @@ Simplified version - backgrounds are added after animation transforms.
 """
 from __future__ import annotations
 
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional, Union
 from xml.etree import ElementTree as ET
 from io import BytesIO
@@ -19,6 +23,17 @@ except Exception:
     ImageDraw = None
     ImageColor = None
 
+# SVG animation elements stripped before rasterizing (frames re-create motion)
+_ANIM_TAGS = frozenset({'animate', 'animateTransform', 'animateMotion', 'set'})
+
+# Default cycle durations in seconds, matching Animator's defaults
+_DEFAULT_SECONDS = {
+    'spin': 4.0,
+    'pulse': 1.5,
+    'flip-h': 1.0,
+    'flip-v': 1.0,
+}
+
 
 def svg_animation_to_webp(
     svg_content: str,
@@ -34,6 +49,7 @@ def svg_animation_to_webp(
     outline_color: Optional[str] = None,
     bg_direction: str = 'horizontal',
     scale: float = 0.85,
+    lossless: Optional[bool] = None,
 ) -> Optional[str]:
     """Rasterize SVG frames for animation and save as animated WebP.
 
@@ -51,6 +67,8 @@ def svg_animation_to_webp(
         outline_color: Border color
         bg_direction: Gradient direction ('horizontal', 'vertical', 'diagonal')
         scale: Icon size as fraction of canvas (0.85 = 85% of canvas size)
+        lossless: Force lossless WebP encoding; None auto-selects it for
+            flat-color content (icons over solid/no background)
 
     Returns:
         Output path string on success, None on failure
@@ -72,35 +90,29 @@ def svg_animation_to_webp(
             anim_type = str(animation_spec).strip().lower()
             dur_part = None
 
-    # Default durations matching Animator
-    defaults = {
-        'spin': '4s',
-        'pulse': '1.5s',
-        'flip-h': '1s',
-        'flip-v': '1s',
-    }
-
     # Calculate total animation duration
     if anim_type in ('flip-h', 'flip-v'):
-        base_dur = dur_part or defaults.get(anim_type, '1s')
-        flip_dur = _dur_to_seconds(base_dur)
+        flip_dur = _dur_to_seconds(dur_part) if dur_part else _DEFAULT_SECONDS[anim_type]
         total_seconds = flip_dur * 10.0
     else:
-        dur = dur_part or defaults.get(anim_type, '2s')
-        total_seconds = _dur_to_seconds(dur)
+        if dur_part:
+            total_seconds = _dur_to_seconds(dur_part)
+        else:
+            total_seconds = _DEFAULT_SECONDS.get(anim_type, 2.0)
 
     frames_count = max(1, int(fps * total_seconds))
 
     # Clean SVG: remove existing animation elements
     try:
         root = ET.fromstring(svg_content)
+        # One child->parent map makes removal O(N) instead of re-walking
+        # the tree to locate each element's parent
+        parent_map = {child: parent for parent in root.iter() for child in parent}
         for el in list(root.iter()):
-            tag = el.tag.split('}')[-1] if '}' in el.tag else el.tag
-            if tag in ('animate', 'animateTransform', 'animateMotion', 'set'):
-                for parent in root.iter():
-                    if el in list(parent):
-                        parent.remove(el)
-                        break
+            if el.tag.rpartition('}')[2] in _ANIM_TAGS:
+                parent = parent_map.get(el)
+                if parent is not None:
+                    parent.remove(el)
     except ET.ParseError:
         print("Error: invalid SVG provided for WebP export")
         return None
@@ -110,7 +122,7 @@ def svg_animation_to_webp(
     
     try:
         base_png = cairosvg.svg2png(
-            bytestring=ET.tostring(root, encoding='unicode').encode('utf-8'),
+            bytestring=ET.tostring(root, encoding='utf-8'),
             output_width=icon_size,
             output_height=icon_size
         )
@@ -129,27 +141,45 @@ def svg_animation_to_webp(
         
         # Generate gradient or solid color
         if isinstance(bg_color, tuple) and len(bg_color) == 2:
-            # Gradient
+            # Gradient. The interpolation only has `size` distinct values
+            # along the gradient axis, so build a 1px strip in O(size)
+            # Python work and let Pillow's C resize stretch it across the
+            # canvas, instead of looping over all size^2 pixels.
             left_rgb = ImageColor.getrgb(bg_color[0])
             right_rgb = ImageColor.getrgb(bg_color[1])
-            
-            # Create gradient image
-            grad = Image.new('RGBA', (size, size))
-            pixels = grad.load()
-            
-            for y in range(size):
-                for x in range(size):
-                    if bg_direction == 'vertical':
-                        ratio = y / (size - 1) if size > 1 else 0
-                    elif bg_direction == 'diagonal':
-                        ratio = (x + y) / (2 * (size - 1)) if size > 1 else 0
-                    else:  # horizontal
-                        ratio = x / (size - 1) if size > 1 else 0
-                    
-                    r = int(left_rgb[0] * (1 - ratio) + right_rgb[0] * ratio)
-                    g = int(left_rgb[1] * (1 - ratio) + right_rgb[1] * ratio)
-                    b = int(left_rgb[2] * (1 - ratio) + right_rgb[2] * ratio)
-                    pixels[x, y] = (r, g, b, 255)
+
+            if bg_direction == 'diagonal':
+                # Diagonal has 2*size-1 distinct values along x+y: build
+                # that 1-D LUT once, then assemble row y as the byte slice
+                # lut[x+y] for x in 0..size-1 -- each row is one C-level
+                # bytes copy instead of size pixel writes.
+                steps = 2 * size - 1
+                denom = (steps - 1) or 1
+                lut = bytearray()
+                for i in range(steps):
+                    ratio = i / denom
+                    lut.append(int(left_rgb[0] + (right_rgb[0] - left_rgb[0]) * ratio))
+                    lut.append(int(left_rgb[1] + (right_rgb[1] - left_rgb[1]) * ratio))
+                    lut.append(int(left_rgb[2] + (right_rgb[2] - left_rgb[2]) * ratio))
+                    lut.append(255)
+                lut = bytes(lut)
+                rows = b''.join(lut[4 * y:4 * (y + size)] for y in range(size))
+                grad = Image.frombytes('RGBA', (size, size), rows)
+            else:
+                strip = Image.new('RGBA', (size, 1))
+                denom = (size - 1) or 1
+                strip.putdata([
+                    (
+                        int(left_rgb[0] + (right_rgb[0] - left_rgb[0]) * i / denom),
+                        int(left_rgb[1] + (right_rgb[1] - left_rgb[1]) * i / denom),
+                        int(left_rgb[2] + (right_rgb[2] - left_rgb[2]) * i / denom),
+                        255,
+                    )
+                    for i in range(size)
+                ])
+                if bg_direction == 'vertical':
+                    strip = strip.transpose(Image.ROTATE_270)
+                grad = strip.resize((size, size), resample=Image.NEAREST)
             
             # Apply rounded mask if needed
             if border_radius > 0:
@@ -195,18 +225,56 @@ def svg_animation_to_webp(
             else:
                 return -1.0 + 2.0 * (progress - 0.5)
 
-    # Generate frames
-    frames = []
-    
-    for i in range(frames_count):
+    # Frame-invariant icon states: flips only ever need two images, and
+    # spin angles repeat at symmetric points, so cache per unique angle.
+    if anim_type in ('flip-h', 'flip-v'):
+        flip_method = Image.FLIP_LEFT_RIGHT if anim_type == 'flip-h' else Image.FLIP_TOP_BOTTOM
+        flipped_icon = base_icon.transpose(flip_method)
+        # Evaluate the piecewise flip timing once per frame index up front;
+        # the loop body then only needs a list lookup.
+        base_flip_dur = total_seconds / 10.0
+        flip_cycle = total_seconds
+        flipped_mask = [
+            flip_scale_at_time((i / frames_count * total_seconds) % flip_cycle, base_flip_dur) < 0
+            for i in range(frames_count)
+        ]
+
+    # For spin, pad the base raster once to the worst-case rotation
+    # bounding box and rotate with expand=False: every frame has the
+    # same dimensions (stable centering, no per-angle bbox clipping).
+    if anim_type == 'spin':
+        pad_size = math.ceil(icon_size * math.sqrt(2)) + 2
+        spin_base = Image.new('RGBA', (pad_size, pad_size), (0, 0, 0, 0))
+        offset = (pad_size - base_icon.width) // 2, (pad_size - base_icon.height) // 2
+        spin_base.paste(base_icon, offset)
+
+    @lru_cache(maxsize=frames_count)
+    def rotate_at(angle: float):
+        return spin_base.rotate(-angle, resample=Image.BICUBIC, expand=False)
+
+    # Outline is frame-invariant: rasterize the rounded rectangle once
+    # and composite the overlay per frame instead of redrawing it.
+    outline_overlay = None
+    if outline_width > 0 and outline_color:
+        outline_overlay = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+        half_width = outline_width / 2
+        ImageDraw.Draw(outline_overlay).rounded_rectangle(
+            [half_width, half_width, size - half_width, size - half_width],
+            radius=max(0, border_radius - half_width),
+            outline=outline_color,
+            width=int(outline_width),
+        )
+
+    # Frames are independent of one another and Pillow releases the GIL
+    # in its C-level rotate/resize/composite ops, so render them on a
+    # thread pool. base_icon/bg_image are read-only in the frame body.
+    def render_frame(i: int):
         t = i / frames_count if frames_count > 0 else 0.0
-        abs_time = t * total_seconds
-        
+
         # Apply animation transform to icon (no background yet)
         if anim_type == 'spin':
-            angle = 360.0 * t
-            animated_icon = base_icon.rotate(-angle, resample=Image.BICUBIC, expand=True)
-            
+            animated_icon = rotate_at(round(360.0 * t, 1))
+
         elif anim_type == 'pulse':
             # Pulse between 100% and 110% scale
             if t <= 0.5:
@@ -220,80 +288,76 @@ def svg_animation_to_webp(
             animated_icon = base_icon.resize((new_w, new_h), resample=Image.LANCZOS)
             
         elif anim_type in ('flip-h', 'flip-v'):
-            base_flip_dur = _dur_to_seconds(dur_part or defaults.get(anim_type, '1s'))
-            t_in_cycle = abs_time % (base_flip_dur * 10.0)
-            scale_val = flip_scale_at_time(t_in_cycle, base_flip_dur)
-            
-            if scale_val < 0:
-                if anim_type == 'flip-h':
-                    animated_icon = base_icon.transpose(Image.FLIP_LEFT_RIGHT)
-                else:
-                    animated_icon = base_icon.transpose(Image.FLIP_TOP_BOTTOM)
-            else:
-                animated_icon = base_icon.copy()
+            animated_icon = flipped_icon if flipped_mask[i] else base_icon
         else:
             # No animation
-            animated_icon = base_icon.copy()
+            animated_icon = base_icon
 
         # Now compose the final frame: background + centered icon
-        if bg_image:
-            # Start with background
-            frame = bg_image.copy()
-        else:
-            # Transparent background
-            frame = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-        
+        frame = bg_image.copy() if bg_image else Image.new('RGBA', (size, size), (0, 0, 0, 0))
+
         # Center the animated icon on the canvas
         icon_w, icon_h = animated_icon.size
         x = (size - icon_w) // 2
         y = (size - icon_h) // 2
-        
-        # Create icon layer and paste centered
-        icon_layer = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-        icon_layer.paste(animated_icon, (x, y), animated_icon)
-        
-        # Composite icon on top of background
-        frame = Image.alpha_composite(frame, icon_layer)
 
-        # Add outline if specified
-        if outline_width > 0 and outline_color:
-            draw = ImageDraw.Draw(frame)
-            half_width = outline_width / 2
-            draw.rounded_rectangle(
-                [half_width, half_width, size - half_width, size - half_width],
-                radius=max(0, border_radius - half_width),
-                outline=outline_color,
-                width=int(outline_width)
+        # Composite directly at the offset; crop first if the icon
+        # overhangs the canvas (spin with expand=True, pulse > 100%)
+        if x < 0 or y < 0:
+            left = max(0, -x)
+            top = max(0, -y)
+            animated_icon = animated_icon.crop(
+                (left, top, left + min(size, icon_w), top + min(size, icon_h))
             )
-        
-        frames.append(frame)
+            x = max(0, x)
+            y = max(0, y)
+        frame.alpha_composite(animated_icon, dest=(x, y))
 
-    if not frames:
-        print("No frames generated for animated WebP")
-        return None
+        # Add outline if specified
+        if outline_overlay:
+            frame.alpha_composite(outline_overlay)
 
-    # Save as animated WebP
-    try:
-        duration_ms = int((total_seconds * 1000) / frames_count) if frames_count > 0 else 50
-        duration_ms = max(1, duration_ms)
-        
-        frames[0].save(
-            output_path,
-            format='WEBP',
-            save_all=True,
-            append_images=frames[1:],
-            duration=duration_ms,
-            loop=loop,
-            quality=quality,
-        )
-        
-        # Cleanup
-        base_icon.close()
-        for frame in frames:
-            frame.close()
-        
+        return frame
+
+    # Save as animated WebP, feeding frames to the encoder as they are
+    # rendered instead of collecting them in our own list first.
+    # (Pillow's WebP saver still materializes append_images internally,
+    # so this removes our copy of the list, not Pillow's.)
+    duration_ms = int((total_seconds * 1000) / frames_count) if frames_count > 0 else 50
+    duration_ms = max(1, duration_ms)
+
+    def save_stream(frame_iter) -> Optional[str]:
+        first = next(frame_iter, None)
+        if first is None:
+            print("No frames generated for animated WebP")
+            return None
+        # Icons over a solid (or no) background are flat screen content,
+        # where WebP's lossless path beats lossy VP8 on both size and
+        # fidelity. Auto-detect via the first frame's palette size.
+        use_lossless = lossless
+        if use_lossless is None and (bg_color is None or isinstance(bg_color, str)):
+            use_lossless = first.getcolors(256) is not None
+        try:
+            first.save(
+                output_path,
+                format='WEBP',
+                save_all=True,
+                append_images=frame_iter,
+                duration=duration_ms,
+                loop=loop,
+                quality=quality,
+                lossless=bool(use_lossless),
+            )
+        except Exception as e:
+            print(f"Error saving animated WebP: {e}")
+            return None
+        finally:
+            first.close()
+            base_icon.close()
         return str(output_path)
-        
-    except Exception as e:
-        print(f"Error saving animated WebP: {e}")
-        return None
\ No newline at end of file
+
+    max_workers = min(os.cpu_count() or 1, frames_count)
+    if max_workers > 1 and frames_count >= 8:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return save_stream(pool.map(render_frame, range(frames_count)))
+    return save_stream(map(render_frame, range(frames_count)))
\ No newline at end of file
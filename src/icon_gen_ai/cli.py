@@ -1,38 +1,68 @@
 """Command-line interface for icon-gen-ai."""
 
 import os
+import re
+
 import click
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import urlparse
-from .generator import IconGenerator
-from importlib.metadata import version
-
-VERSION = version("icon-gen-ai")
 
 # -------------------- HELPERS --------------------
 
+# The same input string gets parsed by is_url and again for the
+# output-name fallback; memoize so each unique value is tokenized once
+_urlparse = lru_cache(maxsize=512)(urlparse)
+
+
 def is_url(value: str) -> bool:
-    parsed = urlparse(value)
-    return parsed.scheme in ("http", "https")
+    # The only accepted schemes are http(s), so a prefix check decides
+    # without tokenizing Iconify names or file paths through urlparse
+    return value.startswith(("http://", "https://"))
+
+
+# Gradient grammar compiled once; results memoized per unique value
+# since the same color strings repeat across batch invocations
+_GRAD_RE = re.compile(r"^\(\s*([^,]+?)\s*,\s*([^,]+?)\s*\)$")
+_color_cache: dict[str, str | tuple[str, str] | None] = {}
 
 
 def parse_color(value: str | None, label: str):
-    if not value or value.lower() == "none":
+    if not value:
         return None
-
-    if value.startswith("(") and value.endswith(")"):
-        colors = [c.strip() for c in value[1:-1].split(",")]
-        if len(colors) != 2:
+    try:
+        return _color_cache[value]
+    except KeyError:
+        pass
+
+    if value.lower() == "none":
+        parsed = None
+    elif value.startswith("(") and value.endswith(")"):
+        match = _GRAD_RE.match(value)
+        if not match:
             raise click.BadParameter(
                 f"{label} gradient must have exactly 2 colors: (color1,color2)"
             )
-        return tuple(colors)
+        parsed = (match.group(1), match.group(2))
+    else:
+        parsed = value
+
+    if len(_color_cache) >= 256:
+        _color_cache.clear()
+    _color_cache[value] = parsed
+    return parsed
 
-    return value
+
+# Shared option types and the extensions accepted for format inference
+_FORMAT_CHOICE = click.Choice(["svg", "png", "webp"])
+_DIRECTION_CHOICE = click.Choice(["horizontal", "vertical", "diagonal"])
+_OUTPUT_EXTENSIONS = frozenset({"svg", "png", "webp", "ico"})
 
 
 # -------------------- CLI --------------------
-@click.version_option(version=VERSION, package_name="icon-gen-ai")
+# Click resolves the version from package metadata only when --version
+# is actually passed, keeping the metadata scan off the startup path
+@click.version_option(package_name="icon-gen-ai")
 @click.group()
 def cli():
     """icon-gen-ai — generate icons from Iconify, URLs, or local files."""
@@ -45,13 +75,13 @@ def cli():
 @click.argument("icon", required=False)
 @click.option("-i", "--input", "input_file", help="Local image file or direct URL")
 @click.option("-o", "--output", help="Output file path")
-@click.option("--format", default="svg", type=click.Choice(["svg", "png", "webp"]))
+@click.option("--format", default="svg", type=_FORMAT_CHOICE)
 @click.option("--size", default=256, show_default=True)
 @click.option("--scale", type=float, help="Icon scale (0.0-1.0). Default: 1.0 without bg, 0.7 with bg")
 @click.option("--color", help="Icon color or gradient '(c1,c2)'")
-@click.option("--direction", default="horizontal", type=click.Choice(["horizontal", "vertical", "diagonal"]), show_default=True, help="Icon gradient direction")
+@click.option("--direction", default="horizontal", type=_DIRECTION_CHOICE, show_default=True, help="Icon gradient direction")
 @click.option("--bg-color", help="Background color or gradient '(c1,c2)'")
-@click.option("--bg-direction", default="horizontal", type=click.Choice(["horizontal", "vertical", "diagonal"]), show_default=True, help="Background gradient direction")
+@click.option("--bg-direction", default="horizontal", type=_DIRECTION_CHOICE, show_default=True, help="Background gradient direction")
 @click.option("--border-radius", default=0, show_default=True)
 @click.option("--outline-width", default=0, show_default=True)
 @click.option("--outline-color", help="Outline color")
@@ -108,17 +138,17 @@ def generate(
     icon_name = icon
 
     if input_file:
-        # Check if it's an Iconify icon name (contains colon)
-        if ':' in input_file and not is_url(input_file) and not os.path.exists(input_file):
-            # It's an Iconify icon name used with -i flag
+        # One filesystem probe: URL first (no stat), then existing file,
+        # then an Iconify icon name (contains colon) used with -i flag
+        if is_url(input_file):
+            direct_url = input_file
+        elif os.path.exists(input_file):
+            local_file = input_file
+        elif ':' in input_file:
             icon_name = input_file
             input_file = None
-        elif is_url(input_file):
-            direct_url = input_file
         else:
-            if not os.path.exists(input_file):
-                raise click.FileError(input_file, hint="File does not exist")
-            local_file = input_file
+            raise click.FileError(input_file, hint="File does not exist")
 
     # Parse colors
     parsed_color = parse_color(color, "Icon color")
@@ -133,30 +163,32 @@ def generate(
         # Infer format from extension if output path is specified
         if output_path.suffix:
             inferred_format = output_path.suffix.lstrip('.')
-            if inferred_format in ['svg', 'png', 'webp', 'ico']:
+            if inferred_format in _OUTPUT_EXTENSIONS:
                 format = inferred_format
     elif local_file:
         output_name = Path(local_file).stem
     elif direct_url:
-        output_name = Path(urlparse(direct_url).path).stem or "icon"
+        output_name = Path(_urlparse(direct_url).path).stem or "icon"
     else:
         output_name = icon_name.replace(":", "_").replace("/", "_")
 
-    generator = IconGenerator(output_dir=str(output_dir))
-
-    click.echo("\nGenerating icon")
-    click.echo(f"  Source: {icon_name or input_file}")
-    click.echo(f"  Size: {size}px")
-    if scale is not None:
-        click.echo(f"  Scale: {scale:.0%}")
-    click.echo(f"  Color: {parsed_color or 'original'}")
-    click.echo(f"  Background: {parsed_bg or 'transparent'}")
-    click.echo(f"  Border radius: {border_radius}px")
+    # Imported here so --help/providers don't pay for the image stack
+    from .generator import IconGenerator
 
-    click.echo(f"  Animation: {animation or 'none'}")
+    generator = IconGenerator(output_dir=str(output_dir))
 
-    if outline_width > 0:
-        click.echo(f"  Outline: {outline_width}px ({outline_color})")
+    # One buffered write instead of a lock/encode/flush per line
+    click.echo("\n".join(filter(None, [
+        "\nGenerating icon",
+        f"  Source: {icon_name or input_file}",
+        f"  Size: {size}px",
+        f"  Scale: {scale:.0%}" if scale is not None else None,
+        f"  Color: {parsed_color or 'original'}",
+        f"  Background: {parsed_bg or 'transparent'}",
+        f"  Border radius: {border_radius}px",
+        f"  Animation: {animation or 'none'}",
+        f"  Outline: {outline_width}px ({outline_color})" if outline_width > 0 else None,
+    ])))
 
     result = generator.generate_icon(
         icon_name=icon_name,
@@ -252,19 +284,25 @@ def search(query, count, generate, style, project_type):
     if not generate:
         return
 
+    from .generator import IconGenerator
+
     generator = IconGenerator(output_dir="output")
 
     click.echo("Generating icons...\n")
 
-    for s in response.suggestions[:display_count]:
-        generator.generate_icon(
-            icon_name=s.icon_name,
-            output_name=s.icon_name.replace(":", "_"),
-            size=(s.style_suggestions or {}).get("size", 256),
-            color=(s.style_suggestions or {}).get("color", "white"),
-            bg_color=(s.style_suggestions or {}).get("bg_color"),
-            border_radius=(s.style_suggestions or {}).get("border_radius", 0),
-        )
+    # Batch dispatch: generate_batch overlaps the Iconify fetches on a
+    # thread pool instead of paying one round-trip per suggestion
+    icons = {
+        s.icon_name.replace(":", "_"): {
+            "icon": s.icon_name,
+            "size": (s.style_suggestions or {}).get("size", 256),
+            "color": (s.style_suggestions or {}).get("color", "white"),
+            "bg_color": (s.style_suggestions or {}).get("bg_color"),
+            "border_radius": (s.style_suggestions or {}).get("border_radius", 0),
+        }
+        for s in response.suggestions[:display_count]
+    }
+    generator.generate_batch(icons)
 
 
 # -------------------- PROVIDERS --------------------
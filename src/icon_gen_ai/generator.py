@@ -1,40 +1,392 @@
 """Core icon generation logic using Iconify API, direct URLs, and local files."""
 
+import asyncio
+import copy
+import hashlib
+import os
+import tempfile
+import threading
+import time
 import requests
 import re
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
 from typing import Optional, Literal, Union, Tuple
 from xml.etree import ElementTree as ET
 from io import BytesIO
-from .animation import Animator
-from .animation.webp_exporter import svg_animation_to_webp
 
-try:
-    from PIL import Image, ImageColor
-    import cairosvg
-    RASTER_AVAILABLE = True
-except ImportError:
-    RASTER_AVAILABLE = False
-    print("Warning: PIL/cairosvg not available. Gradient icons may not work properly.")
+# The animation stack is imported on first animated request (see
+# generate_icon): pure-static workloads never pay for it at import time.
+
+# PIL and cairosvg are imported on first use (see _ensure_raster): SVG-only
+# workloads never touch them, and importing cairosvg in particular pulls in
+# the native cairo stack. None means "not probed yet".
+Image = None
+ImageColor = None
+cairosvg = None
+RASTER_AVAILABLE: Optional[bool] = None
+
+
+def _ensure_raster() -> bool:
+    """Import PIL/cairosvg on first use; return whether raster ops work."""
+    global Image, ImageColor, cairosvg, RASTER_AVAILABLE
+    if RASTER_AVAILABLE is None:
+        try:
+            from PIL import Image as _Image, ImageColor as _ImageColor
+            import cairosvg as _cairosvg
+        except ImportError:
+            RASTER_AVAILABLE = False
+            print("Warning: PIL/cairosvg not available. Gradient icons may not work properly.")
+        else:
+            Image, ImageColor, cairosvg = _Image, _ImageColor, _cairosvg
+            RASTER_AVAILABLE = True
+    return bool(RASTER_AVAILABLE)
 
 FormatType = Literal["svg", "png", "webp", "ico"]
 
+# How long cached downloads stay fresh (30 days).
+CACHE_TTL_SECONDS = 30 * 24 * 3600
+
+# Upper bound for direct-URL downloads; anything larger than this is not a
+# plausible icon and would only balloon memory before failing downstream.
+MAX_DOWNLOAD_BYTES = 10 * 1024 * 1024
+
+# Strips units like "1em"/"24px" when deriving a viewBox from width/height.
+_NON_NUMERIC_RE = re.compile(r"[^\d.]")
+
+# Fast-path regexes for simple Iconify-shaped SVGs (see modify_svg_fast).
+_FAST_FILL_RE = re.compile(r'\b(fill|stroke)="(?!none"|transparent"|currentColor")[^"]*"')
+_FAST_WIDTH_RE = re.compile(r'\bwidth="[^"]*"')
+_FAST_HEIGHT_RE = re.compile(r'\bheight="[^"]*"')
+# Visual element missing a fill attribute -> structure too complex for regexes.
+_FAST_UNFILLED_RE = re.compile(r'<(?:path|circle|rect|polygon|ellipse|polyline|line|text)\b(?![^>]*\bfill=)')
+
+# Base64 payload of a self-embedded raster source (see load_local_file).
+_RASTER_HREF_RE = re.compile(r'href="data:image/png;base64,([^"]+)"')
+
+# Per-icon overrides a batch config dict may carry (see _generate_from_config).
+_BATCH_CONFIG_KEYS = frozenset({
+    'size', 'scale', 'color', 'direction', 'bg_color', 'bg_direction',
+    'border_radius', 'outline_width', 'outline_color', 'animation',
+})
+
+# Minification patterns (see _minify_svg): inter-tag whitespace, comments,
+# and float coordinates beyond 4 decimal places.
+_INTER_TAG_WS_RE = re.compile(rb'>\s+<')
+_BYTE_COMMENT_RE = re.compile(rb'<!--.*?-->', re.DOTALL)
+_EXCESS_PRECISION_RE = re.compile(rb'(\d+\.\d{4})\d+')
+
+# Paint attribute values, for detecting already-colored responses.
+_PAINT_VALUE_RE = re.compile(r'\b(?:fill|stroke)="([^"]+)"')
+
+# Prologue constructs stdlib ElementTree refuses to parse (see _fromstring_lenient).
+_DOCTYPE_RE = re.compile(r'<!DOCTYPE[^>[]*(?:\[[^\]]*\])?[^>]*>', re.DOTALL)
+_XML_COMMENT_RE = re.compile(r'<!--.*?-->', re.DOTALL)
+
+# Visual tags targeted by the recolor pass (namespace-stripped).
+VISUAL_TAGS = frozenset({
+    'path', 'circle', 'rect', 'polygon', 'ellipse',
+    'polyline', 'line', 'text', 'g',
+})
+
+_SVG_NS = "http://www.w3.org/2000/svg"
+
+# Serialize SVG elements in the default (unprefixed) namespace. Without this
+# registration ET.tostring emits ns0:-prefixed tags, and helpers that slice
+# the root tag away (_inner_markup) would emit references to a prefix whose
+# declaration was cut off with it — producing unparseable output.
+ET.register_namespace("", _SVG_NS)
+
+# The same tags in both plain and Clark notation, for tag-filtered iter()
+# calls that skip <title>/<desc>/<defs>/etc. at the C level.
+_PAINTABLE_TAGS = tuple(
+    (tag, qualified)
+    for tag in sorted(VISUAL_TAGS)
+    for qualified in (tag, f'{{{_SVG_NS}}}{tag}')
+)
+
+
+def _svg_already_colored(svg_content: str, color: str) -> bool:
+    """True when every fill/stroke in the SVG already is `color` (or none).
+
+    The Iconify API substitutes the requested color server-side, so for most
+    icons the response needs no client-side recolor pass at all. A cheap
+    substring scan decides that; anything ambiguous (styles, no paint
+    attributes) reports False and goes through the normal path.
+    """
+    if '<style' in svg_content:
+        return False
+    values = _PAINT_VALUE_RE.findall(svg_content)
+    if not values:
+        return False
+    color_lower = color.lower()
+    return all(v.lower() in (color_lower, 'none') for v in values)
+
+
+def _apply_color_inplace(root: ET.Element, color: str) -> None:
+    """Recolor fill/stroke attributes across a parsed tree in one flat pass.
+
+    This is the hot loop for complex third-party SVGs, so it lives at module
+    level (no per-call closure state) and touches each element's attrib dict
+    directly instead of going through get()/set() method dispatch twice per
+    attribute. Iterating per paintable tag keeps the node filtering inside
+    ElementTree's C walker, so <title>/<desc>/<defs>/<metadata> nodes never
+    reach Python at all.
+    """
+    for tag, qualified in _PAINTABLE_TAGS:
+        for el in root.iter(qualified):
+            attrib = el.attrib
+            current_fill = attrib.get('fill', '')
+            if current_fill:
+                if current_fill != color and current_fill.lower() not in ('none', 'transparent', 'currentcolor'):
+                    attrib['fill'] = color
+            elif tag != 'g':
+                attrib['fill'] = color
+
+            stroke = attrib.get('stroke')
+            if stroke and stroke != color and stroke.lower() not in ('none', 'transparent'):
+                attrib['stroke'] = color
+
+
+def _minify_svg(data: bytes) -> bytes:
+    """Shrink serialized SVG: drop comments and inter-tag whitespace, trim
+    coordinates to 4 decimal places. Downloaded icons routinely carry 10+
+    decimals and pretty-printing that inflate files several-fold without
+    any visual difference at icon sizes."""
+    data = _BYTE_COMMENT_RE.sub(b'', data)
+    data = _INTER_TAG_WS_RE.sub(b'><', data)
+    data = _EXCESS_PRECISION_RE.sub(rb'\1', data)
+    return data.strip()
+
+
+def _fromstring_lenient(svg_content: str) -> ET.Element:
+    """Parse SVG, retrying without DOCTYPE/comments when strict parsing fails.
+
+    Third-party SVGs (CDN logos etc.) often carry DOCTYPEs with internal
+    subsets or stray comments that stdlib ElementTree rejects; stripping
+    those on the retry lets size/color edits apply instead of silently
+    returning the content unmodified. The common well-formed case pays
+    nothing extra.
+    """
+    try:
+        return ET.fromstring(svg_content)
+    except ET.ParseError:
+        cleaned = _DOCTYPE_RE.sub('', _XML_COMMENT_RE.sub('', svg_content))
+        return ET.fromstring(cleaned)
+
+
+def _inner_markup(root: ET.Element) -> str:
+    """Serialize an element's children with a single tostring call.
+
+    Serializing each child separately re-runs namespace handling per
+    element; serializing the root once and slicing off its outer tags
+    produces the same inner markup in one pass. That slice is only valid
+    when the root serializes unprefixed (the default-namespace
+    registration at module scope guarantees it for SVG); any prefixed
+    root would have its binding cut off with the outer tag, so that case
+    falls back to per-child serialization where each child carries its
+    own xmlns.
+    """
+    serialized = ET.tostring(root, encoding="unicode")
+    head, sep, rest = serialized.partition('>')
+    if not sep or head.endswith('/'):
+        return ""
+    if head.startswith('<' + root.tag.rpartition('}')[2]):
+        inner, closing, _ = rest.rpartition('</')
+        return inner if closing else rest
+    return "".join(ET.tostring(child, encoding="unicode") for child in root)
+
+
+def _ensure_viewbox(root: ET.Element) -> None:
+    """Derive a viewBox from width/height when the source omits one."""
+    if not root.get("viewBox"):
+        w = _NON_NUMERIC_RE.sub("", root.get("width", "24"))
+        h = _NON_NUMERIC_RE.sub("", root.get("height", "24"))
+        root.set("viewBox", f"0 0 {w} {h}")
+
+
+def _wrap_scaled(root: ET.Element, scale: float, default_viewbox: str = "0 0 24 24") -> None:
+    """Move the root's children into a <g> scaled about the viewBox center."""
+    vb = root.get("viewBox", default_viewbox).split()
+    vb_x, vb_y, vb_w, vb_h = map(float, vb)
+
+    g = ET.Element("g")
+    cx, cy = vb_w / 2, vb_h / 2
+    g.set("transform", f"translate({cx},{cy}) scale({scale}) translate({-cx},{-cy})")
+
+    for child in list(root):
+        root.remove(child)
+        g.append(child)
+    root.append(g)
+
+
+def _gradient_image(
+    left_rgb: Tuple[int, int, int],
+    right_rgb: Tuple[int, int, int],
+    width: int,
+    height: int,
+    direction: str,
+) -> "Image.Image":
+    """Build an opaque RGBA gradient without touching individual pixels.
+
+    Horizontal/vertical gradients only have one distinct color per column
+    (or row), so a 1px strip stretched by Pillow's C resize covers the
+    canvas; diagonal gradients use a 1-D LUT along x+y sliced into rows
+    as bytes. Both stay O(width+height) in Python.
+    """
+    if direction == "diagonal":
+        steps = width + height - 1
+        denom = (steps - 1) or 1
+        lut = bytearray()
+        for i in range(steps):
+            ratio = i / denom
+            lut.append(int(left_rgb[0] + (right_rgb[0] - left_rgb[0]) * ratio))
+            lut.append(int(left_rgb[1] + (right_rgb[1] - left_rgb[1]) * ratio))
+            lut.append(int(left_rgb[2] + (right_rgb[2] - left_rgb[2]) * ratio))
+            lut.append(255)
+        lut = bytes(lut)
+        rows = b''.join(lut[4 * y:4 * (y + width)] for y in range(height))
+        return Image.frombytes('RGBA', (width, height), rows)
+
+    length = height if direction == "vertical" else width
+    denom = (length - 1) or 1
+    strip = Image.new('RGBA', (length, 1))
+    strip.putdata([
+        (
+            int(left_rgb[0] + (right_rgb[0] - left_rgb[0]) * i / denom),
+            int(left_rgb[1] + (right_rgb[1] - left_rgb[1]) * i / denom),
+            int(left_rgb[2] + (right_rgb[2] - left_rgb[2]) * i / denom),
+            255,
+        )
+        for i in range(length)
+    ])
+    if direction == "vertical":
+        strip = strip.transpose(Image.ROTATE_270)
+    return strip.resize((width, height), resample=Image.NEAREST)
+
 
+@lru_cache(maxsize=256)
 def parse_color(color: str) -> Tuple[int, int, int]:
     """Parse color string to RGB tuple (supports hex and CSS3 named colors)."""
+    if not _ensure_raster():
+        return (255, 255, 255)
     try:
         rgb = ImageColor.getrgb(color)
         return rgb[:3] if len(rgb) >= 3 else rgb
-    except:
+    except ValueError:
         return (255, 255, 255)  # Default to white
 
 
 class IconGenerator:
     ICONIFY_API = "https://api.iconify.design"
 
-    def __init__(self, output_dir: str = "output"):
+    def __init__(self, output_dir: str = "output", enable_caching: bool = True, minify: bool = True):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        self.minify = minify
+
+        # On-disk cache so repeat runs skip the network entirely
+        # (same location scheme as the AI assistant's response cache).
+        self.enable_caching = enable_caching
+        self._cache_dir = Path.home() / ".icon-gen" / "cache" / "icons"
+        if self.enable_caching:
+            try:
+                self._cache_dir.mkdir(parents=True, exist_ok=True)
+            except OSError:
+                self.enable_caching = False
+
+        # Keep-alive session so repeated fetches against the same host
+        # (typically api.iconify.design) reuse one TCP/TLS connection
+        # instead of paying a fresh handshake per icon.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=16,
+            max_retries=Retry(total=2, backoff_factor=0.2),
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._session.headers.update({"User-Agent": "Mozilla/5.0"})
+
+        # In-memory memo of fetched SVGs so a batch that reuses the same
+        # (icon_name, color) under several output names fetches it once.
+        # Per-key locks keep concurrent batch workers from racing the fetch.
+        self._svg_memo: dict[tuple, str] = {}
+        self._url_memo: dict[tuple, tuple[str, bool]] = {}
+        self._memo_locks: dict[tuple, threading.Lock] = {}
+        self._memo_guard = threading.Lock()
+
+        # Parsed-tree cache keyed by content: a batch requesting the same
+        # icon in several variants parses the XML once and copies the tree.
+        self._tree_cache: dict[str, ET.Element] = {}
+
+        # Directories already created, so batch loops writing into the same
+        # output dir skip the per-icon mkdir/stat. Guarded by a lock since
+        # generate_batch runs workers concurrently.
+        self._ensured_dirs: set[Path] = {self.output_dir}
+        self._ensured_dirs_lock = threading.Lock()
+
+    def _ensure_parent(self, output_path: Path) -> None:
+        """Create the output file's directory once per generator instance."""
+        parent = output_path.parent
+        if parent in self._ensured_dirs:
+            return
+        parent.mkdir(parents=True, exist_ok=True)
+        with self._ensured_dirs_lock:
+            self._ensured_dirs.add(parent)
+
+    # -------------------- DOWNLOAD CACHE --------------------
+    def _cache_path(self, key: str, suffix: str = ".svg") -> Path:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return self._cache_dir / f"{digest}{suffix}"
+
+    def _cache_get(self, key: str, suffix: str = ".svg") -> Optional[bytes]:
+        """Return cached bytes for `key`, or None if missing/stale/disabled."""
+        if not self.enable_caching:
+            return None
+        path = self._cache_path(key, suffix)
+        try:
+            if time.time() - path.stat().st_mtime < CACHE_TTL_SECONDS:
+                return path.read_bytes()
+        except OSError:
+            pass
+        return None
+
+    def _cache_put(self, key: str, data: bytes, suffix: str = ".svg"):
+        """Store `data` under `key`, atomically so readers never see partial files."""
+        if not self.enable_caching:
+            return
+        path = self._cache_path(key, suffix)
+        try:
+            fd, tmp_name = tempfile.mkstemp(dir=self._cache_dir)
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_name, path)
+        except OSError as e:
+            print(f"Warning: Failed to cache download: {e}")
+
+    def clear_cache(self):
+        """Remove all cached downloads."""
+        if not self._cache_dir.exists():
+            return
+        import shutil
+        try:
+            shutil.rmtree(self._cache_dir)
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            print(f"Error clearing cache: {e}")
+
+    def close(self):
+        """Close the underlying HTTP session."""
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     # -------------------- GRADIENT --------------------
     def create_gradient_def(
@@ -65,7 +417,7 @@ class IconGenerator:
         size: int = 256,
         direction: str = "horizontal",
     ) -> str:
-        if not RASTER_AVAILABLE:
+        if not _ensure_raster():
             print("Cannot apply gradient: PIL/cairosvg not installed")
             return svg_content
         try:
@@ -80,42 +432,22 @@ class IconGenerator:
             left_rgb = parse_color(color1)
             right_rgb = parse_color(color2)
             
-            pixels = list(img.getdata())
-            new_data = []
-            for y in range(height):
-                for x in range(width):
-                    idx = y * width + x
-                    r, g, b, a = pixels[idx]
-                    if a > 0:
-                        if direction == "vertical":
-                            ratio = y / (height - 1) if height > 1 else 0
-                        elif direction == "diagonal":
-                            ratio = (x + y) / (width + height - 2) if (width + height) > 2 else 0
-                        else:  # horizontal
-                            ratio = x / (width - 1) if width > 1 else 0
-                        new_r = int(left_rgb[0] * (1 - ratio) + right_rgb[0] * ratio)
-                        new_g = int(left_rgb[1] * (1 - ratio) + right_rgb[1] * ratio)
-                        new_b = int(left_rgb[2] * (1 - ratio) + right_rgb[2] * ratio)
-                        new_data.append((new_r, new_g, new_b, a))
-                    else:
-                        new_data.append((r, g, b, a))
-            img.putdata(new_data)
-
-            # Convert to SVG rectangles
-            svg_header = f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="0 0 {width} {height}" shape-rendering="crispEdges">\n'
-            svg_content_list = []
-            for y in range(height):
-                for x in range(width):
-                    r, g, b, a = new_data[y * width + x]
-                    if a > 0:
-                        hex_color = f'#{r:02x}{g:02x}{b:02x}'
-                        opacity = a / 255
-                        svg_content_list.append(
-                            f'<rect x="{x}" y="{y}" width="1" height="1" '
-                            f'fill="{hex_color}" fill-opacity="{opacity:.3f}" />'
-                        )
-            svg_footer = '</svg>'
-            return svg_header + '\n'.join(svg_content_list) + svg_footer
+            # The blend result is just the gradient with the icon's alpha:
+            # build the gradient at C speed and stamp the alpha channel on,
+            # instead of interpolating per pixel in Python
+            gradient = _gradient_image(left_rgb, right_rgb, width, height, direction)
+            gradient.putalpha(img.getchannel("A"))
+            img = gradient
+
+            # Convert back to SVG with embedded image (same shape as
+            # recolor_svg_to_single_color) — one <image> instead of a
+            # <rect> per opaque pixel
+            from base64 import b64encode
+            buffer = BytesIO()
+            img.save(buffer, format='PNG')
+            img_data = b64encode(buffer.getvalue()).decode('utf-8')
+
+            return f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="0 0 {width} {height}">\n<image width="{width}" height="{height}" href="data:image/png;base64,{img_data}" />\n</svg>'
 
         except Exception as e:
             print(f"Error applying gradient via raster: {e}")
@@ -130,7 +462,7 @@ class IconGenerator:
         size: int = 256
     ) -> str:
         """Recolor multi-color SVG to single color using raster method."""
-        if not RASTER_AVAILABLE:
+        if not _ensure_raster():
             print("Cannot recolor SVG: PIL/cairosvg not installed")
             print("Install with: pip install Pillow cairosvg")
             return svg_content
@@ -149,17 +481,12 @@ class IconGenerator:
             img = Image.open(BytesIO(png_data)).convert("RGBA")
             width, height = img.size
             
-            # Recolor all non-transparent pixels
-            pixels = list(img.getdata())
-            new_pixels = []
-            for r, g, b, a in pixels:
-                if a > 0:  # Non-transparent pixel
-                    new_pixels.append((*target_rgb, a))
-                else:
-                    new_pixels.append((r, g, b, a))
-            
-            img.putdata(new_pixels)
-            
+            # Recolor all non-transparent pixels: a solid fill carrying
+            # the original alpha channel, no per-pixel Python loop
+            solid = Image.new('RGBA', img.size, (*target_rgb, 255))
+            solid.putalpha(img.getchannel('A'))
+            img = solid
+
             # Convert back to SVG with embedded image
             from base64 import b64encode
             buffer = BytesIO()
@@ -188,12 +515,10 @@ class IconGenerator:
     ) -> str:
         """Wrap SVG icon with a background and optional outline."""
         try:
-            root = ET.fromstring(svg_content)
+            root = _fromstring_lenient(svg_content)
             vb = root.get("viewBox", "0 0 24 24").split()
             vb_x, vb_y, vb_w, vb_h = map(float, vb)
-            icon_elements = "".join(
-                ET.tostring(child, encoding="unicode") for child in root
-            )
+            icon_elements = _inner_markup(root)
         except Exception:
             # Fallback when parsing fails: assume 24x24 viewBox at origin
             vb_x = 0.0
@@ -247,6 +572,60 @@ class IconGenerator:
 </svg>"""
 
     # -------------------- MODIFY SVG --------------------
+    def _parse_cached(self, svg_content: str) -> ET.Element:
+        """Parse SVG content, reusing the cached tree for repeated inputs.
+
+        A batch often requests the same icon in several color/size variants;
+        the fetched markup is identical each time, so every variant after
+        the first starts from a deepcopy of the cached tree instead of a
+        fresh XML parse.
+        """
+        base = self._tree_cache.get(svg_content)
+        if base is None:
+            base = _fromstring_lenient(svg_content)
+            if len(self._tree_cache) >= 32:
+                self._tree_cache.clear()
+            self._tree_cache[svg_content] = base
+        return copy.deepcopy(base)
+
+    def modify_svg_fast(
+        self,
+        svg_content: str,
+        color: Optional[str],
+        size: Optional[int],
+    ) -> Optional[str]:
+        """Regex fast path for simple SVGs, skipping the XML parse entirely.
+
+        Iconify responses are typically a flat `<svg viewBox=...>` with a few
+        `<path fill=...>` children; for those, rewriting width/height and fill
+        attributes with precompiled regexes is far cheaper than a full
+        parse/serialize round-trip. Returns the modified SVG, or None when the
+        content is too complex (styles, animations, gradients, missing
+        attributes) so the caller can fall back to modify_svg.
+        """
+        head, sep, tail = svg_content.partition('>')
+        if not sep or '<svg' not in head:
+            return None
+
+        # Bail out whenever regex edits could diverge from the tree-based path.
+        if '<style' in svg_content or '<animate' in svg_content or '<set' in svg_content:
+            return None
+        if 'url(' in svg_content:
+            return None
+        if 'viewBox' not in head or 'width=' not in head or 'height=' not in head:
+            return None
+        if color and _FAST_UNFILLED_RE.search(svg_content):
+            return None
+
+        if size:
+            head = _FAST_WIDTH_RE.sub(f'width="{size}"', head, count=1)
+            head = _FAST_HEIGHT_RE.sub(f'height="{size}"', head, count=1)
+
+        result = head + sep + tail
+        if color:
+            result = _FAST_FILL_RE.sub(lambda m: f'{m.group(1)}="{color}"', result)
+        return result
+
     def modify_svg(
         self,
         svg_content: str,
@@ -270,13 +649,8 @@ class IconGenerator:
             # If no color specified, just apply size
             if color is None:
                 try:
-                    root = ET.fromstring(svg_content)
-                    
-                    # Ensure viewBox exists
-                    if not root.get("viewBox"):
-                        w = re.sub(r"[^\d.]", "", root.get("width", "24"))
-                        h = re.sub(r"[^\d.]", "", root.get("height", "24"))
-                        root.set("viewBox", f"0 0 {w} {h}")
+                    root = self._parse_cached(svg_content)
+                    _ensure_viewbox(root)
 
                     # Apply size only
                     if size:
@@ -285,20 +659,7 @@ class IconGenerator:
 
                     # Apply scale if provided
                     if scale is not None and scale != 1.0:
-                        # Wrap content in a scaled group
-                        vb = root.get("viewBox", "0 0 24 24").split()
-                        vb_x, vb_y, vb_w, vb_h = map(float, vb)
-                        
-                        # Create wrapper group with transform
-                        g = ET.Element("g")
-                        cx, cy = vb_w / 2, vb_h / 2
-                        g.set("transform", f"translate({cx},{cy}) scale({scale}) translate({-cx},{-cy})")
-                        
-                        # Move all children to the group
-                        for child in list(root):
-                            root.remove(child)
-                            g.append(child)
-                        root.append(g)
+                        _wrap_scaled(root, scale)
 
                     return ET.tostring(root, encoding="unicode")
                 except Exception as e:
@@ -319,20 +680,7 @@ class IconGenerator:
                 if scale is not None and scale != 1.0:
                     try:
                         root = ET.fromstring(svg_content)
-                        vb = root.get("viewBox", "0 0 256 256").split()
-                        vb_x, vb_y, vb_w, vb_h = map(float, vb)
-                        
-                        # Create wrapper group with transform
-                        g = ET.Element("g")
-                        cx, cy = vb_w / 2, vb_h / 2
-                        g.set("transform", f"translate({cx},{cy}) scale({scale}) translate({-cx},{-cy})")
-                        
-                        # Move all children to the group
-                        for child in list(root):
-                            root.remove(child)
-                            g.append(child)
-                        root.append(g)
-                        
+                        _wrap_scaled(root, scale, default_viewbox="0 0 256 256")
                         return ET.tostring(root, encoding="unicode")
                     except Exception as e:
                         print(f"Warning: Could not apply scale to gradient: {e}")
@@ -342,13 +690,8 @@ class IconGenerator:
             # For solid colors with animation preservation
             if color and preserve_animations:
                 try:
-                    root = ET.fromstring(svg_content)
-                    
-                    # Ensure viewBox exists
-                    if not root.get("viewBox"):
-                        w = re.sub(r"[^\d.]", "", root.get("width", "24"))
-                        h = re.sub(r"[^\d.]", "", root.get("height", "24"))
-                        root.set("viewBox", f"0 0 {w} {h}")
+                    root = self._parse_cached(svg_content)
+                    _ensure_viewbox(root)
 
                     # Apply size
                     if size:
@@ -356,55 +699,17 @@ class IconGenerator:
                         root.set("height", str(size))
 
                     # ----- REMOVE STYLE FILLS HERE -----
-                    for style in root.findall(".//{http://www.w3.org/2000/svg}style"):
+                    for style in root.findall(f".//{{{_SVG_NS}}}style"):
                         if 'fill' in (style.text or ''):
                             root.remove(style)
 
-                    # Apply color to fill/stroke attributes (preserves animations)
-                    def apply_color_preserve_animation(el):
-                        tag = el.tag.split('}')[-1] if '}' in el.tag else el.tag
-                        
-                        # Skip animation elements
-                        if tag in ('animate', 'animateTransform', 'animateMotion', 'set', 'style'):
-                            return
-                        
-                        visual_tags = {
-                            'path', 'circle', 'rect', 'polygon', 'ellipse',
-                            'polyline', 'line', 'text', 'g'
-                        }
-                        
-                        if tag in visual_tags:
-                            current_fill = el.get('fill', '')
-                            if current_fill and current_fill.lower() not in ('none', 'transparent', 'currentcolor'):
-                                el.set('fill', color)
-                            elif not current_fill and tag != 'g':
-                                el.set('fill', color)
-                            
-                            if el.get('stroke') and el.get('stroke').lower() not in ('none', 'transparent'):
-                                el.set('stroke', color)
-                        
-                        for child in el:
-                            apply_color_preserve_animation(child)
-                    
-                    apply_color_preserve_animation(root)
+                    # Apply color to fill/stroke attributes (preserves animations).
+                    _apply_color_inplace(root, color)
                     
                     # Apply scale if provided and no background will be added
                     if scale is not None and scale != 1.0:
-                        # Wrap content in a scaled group
-                        vb = root.get("viewBox", "0 0 24 24").split()
-                        vb_x, vb_y, vb_w, vb_h = map(float, vb)
-                        
-                        # Create wrapper group with transform
-                        g = ET.Element("g")
-                        cx, cy = vb_w / 2, vb_h / 2
-                        g.set("transform", f"translate({cx},{cy}) scale({scale}) translate({-cx},{-cy})")
-                        
-                        # Move all children to the group
-                        for child in list(root):
-                            root.remove(child)
-                            g.append(child)
-                        root.append(g)
-                    
+                        _wrap_scaled(root, scale)
+
                     return ET.tostring(root, encoding="unicode")
                     
                 except Exception as e:
@@ -443,7 +748,7 @@ class IconGenerator:
                 print(f"Error reading SVG file {file_path}: {e}")
                 return None
 
-        if not RASTER_AVAILABLE:
+        if not _ensure_raster():
             print("Error: PIL not available. Cannot process raster images.")
             return None
 
@@ -457,7 +762,7 @@ class IconGenerator:
                 if ratio < 1:
                     new_w = max(1, int(round(orig_w * ratio)))
                     new_h = max(1, int(round(orig_h * ratio)))
-                    img = img.resize((new_w, new_h), Image.Resampling.LANCZOS)
+                    img = img.resize((new_w, new_h), Image.Resampling.LANCZOS, reducing_gap=3.0)
 
             width, height = img.size
             
@@ -470,14 +775,11 @@ class IconGenerator:
                     )
                 else:
                     target_rgb = parse_color(target_color)
-                    pixels = list(img.getdata())
-                    new_pixels = []
-                    for r, g, b, a in pixels:
-                        if a > 0:
-                            new_pixels.append((*target_rgb, a))
-                        else:
-                            new_pixels.append((r, g, b, a))
-                    img.putdata(new_pixels)
+                    # Solid fill with the original alpha, as in
+                    # recolor_svg_to_single_color
+                    solid = Image.new('RGBA', img.size, (*target_rgb, 255))
+                    solid.putalpha(img.getchannel('A'))
+                    img = solid
 
             from base64 import b64encode
             buffer = BytesIO()
@@ -501,27 +803,42 @@ class IconGenerator:
         For SVG responses returns the SVG text and False. For raster images
         (png/jpg/webp/etc) returns an SVG wrapper embedding the image as
         a data URI and True.
+
+        Results are memoized per (url, target_size) like get_icon_svg, so
+        batch runs repeating a URL skip the fetch and re-encode entirely.
         """
-        try:
-            r = requests.get(url, headers={"User-Agent": "Mozilla/5.0"}, timeout=10)
-            r.raise_for_status()
+        memo_key = (url, target_size)
+        memoized = self._url_memo.get(memo_key)
+        if memoized is not None:
+            return memoized
 
-            content_type = r.headers.get("Content-Type", "")
+        with self._memo_guard:
+            lock = self._memo_locks.setdefault(("url",) + memo_key, threading.Lock())
+
+        with lock:
+            memoized = self._url_memo.get(memo_key)
+            if memoized is not None:
+                return memoized
+
+            result = self._fetch_icon_from_url(url, target_size)
+            if result is not None:
+                self._url_memo[memo_key] = result
+            return result
+
+    def _fetch_icon_from_url(self, url: str, target_size: Optional[int] = None) -> Optional[tuple[str, bool]]:
+        try:
+            data, content_type = self._fetch_url(url)
 
             # SVG content
             if 'svg' in content_type or url.lower().endswith('.svg'):
-                try:
-                    return (r.text, False)
-                except Exception:
-                    return (r.content.decode('utf-8', errors='replace'), False)
+                return (data.decode('utf-8', errors='replace'), False)
 
             # Raster content (png, jpeg, webp, etc.) - embed as data URI inside an SVG
             if content_type.startswith('image/') or any(url.lower().endswith(ext) for ext in ('.png', '.jpg', '.jpeg', '.webp')):
-                data = r.content
                 from base64 import b64encode
 
                 # If we can, open and optionally resize the image to the target size
-                if RASTER_AVAILABLE:
+                if _ensure_raster():
                     try:
                         img = Image.open(BytesIO(data)).convert('RGBA')
                         # If a target_size was requested, resize to fit within that size
@@ -532,7 +849,7 @@ class IconGenerator:
                             if ratio < 1:
                                 new_w = max(1, int(round(orig_w * ratio)))
                                 new_h = max(1, int(round(orig_h * ratio)))
-                                img = img.resize((new_w, new_h), Image.Resampling.LANCZOS)
+                                img = img.resize((new_w, new_h), Image.Resampling.LANCZOS, reducing_gap=3.0)
                         width, height = img.size
 
                         # Re-encode as PNG for consistent embedding
@@ -558,24 +875,113 @@ class IconGenerator:
                 return (svg_content, True)
 
             # Fallback: try to decode as text
-            return (r.text, False)
+            return (data.decode('utf-8', errors='replace'), False)
         except Exception as e:
             print(f"Error fetching from URL {url}: {e}")
             return None
 
-    def get_icon_svg(self, icon_name: str, color: str = "currentColor") -> Optional[str]:
+    def _fetch_url(self, url: str) -> tuple[bytes, str]:
+        """Fetch raw bytes + content type for `url`, consulting the disk cache first."""
+        cached = self._cache_get(url, suffix=".bin")
+        if cached is not None:
+            content_type = (self._cache_get(url, suffix=".type") or b"").decode("ascii", errors="replace")
+            return cached, content_type
+
+        # Stream the body so an oversized/hostile URL is rejected after one
+        # chunk instead of being buffered whole before any size check.
+        with self._session.get(url, stream=True, timeout=10) as r:
+            r.raise_for_status()
+            content_type = r.headers.get("Content-Type", "")
+
+            declared_size = int(r.headers.get("Content-Length") or 0)
+            if declared_size > MAX_DOWNLOAD_BYTES:
+                raise ValueError(
+                    f"Response too large ({declared_size} bytes, limit {MAX_DOWNLOAD_BYTES})"
+                )
+
+            chunks = []
+            total = 0
+            for chunk in r.iter_content(65536):
+                total += len(chunk)
+                if total > MAX_DOWNLOAD_BYTES:
+                    raise ValueError(
+                        f"Response exceeded download limit ({MAX_DOWNLOAD_BYTES} bytes)"
+                    )
+                chunks.append(chunk)
+            data = b"".join(chunks)
+
+        self._cache_put(url, data, suffix=".bin")
+        self._cache_put(url, content_type.encode("ascii", errors="replace"), suffix=".type")
+        return data, content_type
+
+    def get_icon_svg(
+        self,
+        icon_name: str,
+        color: str = "currentColor",
+        size: Optional[int] = None,
+    ) -> Optional[str]:
+        memo_key = (icon_name, color, size)
+        memoized = self._svg_memo.get(memo_key)
+        if memoized is not None:
+            return memoized
+
+        # One lock per key: identical fetches wait on each other while
+        # distinct icons still download in parallel.
+        with self._memo_guard:
+            lock = self._memo_locks.setdefault(memo_key, threading.Lock())
+
+        with lock:
+            memoized = self._svg_memo.get(memo_key)
+            if memoized is not None:
+                return memoized
+
+            svg = self._fetch_icon_svg(icon_name, color, size)
+            if svg is not None:
+                self._svg_memo[memo_key] = svg
+            return svg
+
+    def _fetch_icon_svg(
+        self, icon_name: str, color: str, size: Optional[int] = None
+    ) -> Optional[str]:
+        """Fetch an Iconify SVG, consulting the disk cache first."""
+        cache_key = f"{icon_name}|{color}|{size or ''}"
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached.decode("utf-8", errors="replace")
+
+        params = {"color": color}
+        if size:
+            # Let the API emit the icon at the target size, so the local
+            # width/height rewrite becomes a no-op.
+            params["width"] = size
+            params["height"] = size
+
         try:
-            r = requests.get(f"{self.ICONIFY_API}/{icon_name}.svg", params={"color":color}, timeout=10)
+            r = self._session.get(f"{self.ICONIFY_API}/{icon_name}.svg", params=params, timeout=10)
             r.raise_for_status()
-            return r.text
+            self._cache_put(cache_key, r.content)
+            # Decode the bytes we already hold; r.text would run charset
+            # detection even though the API always serves UTF-8.
+            return r.content.decode("utf-8", errors="replace")
         except Exception as e:
             print(f"Error fetching icon {icon_name}: {e}")
             return None
 
-    def save_svg(self, svg_content: str, output_path: Path) -> bool:
+    def save_svg(self, svg_content: Union[str, bytes], output_path: Path) -> bool:
+        """Write SVG content in one unbuffered pass.
+
+        Accepts bytes directly so callers that already hold an encoded
+        payload skip the str round-trip; str input is encoded exactly once
+        and written via write_bytes, avoiding the TextIOWrapper layer.
+        Output is minified unless the generator was built with minify=False.
+        """
         try:
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_text(svg_content, encoding="utf-8")
+            if isinstance(svg_content, str):
+                svg_content = svg_content.encode("utf-8")
+            if self.minify:
+                svg_content = _minify_svg(svg_content)
+            self._ensure_parent(output_path)
+            output_path.write_bytes(svg_content)
             return output_path
         except Exception as e:
             print(f"Error saving {output_path}: {e}")
@@ -583,6 +989,7 @@ class IconGenerator:
 
     def generate_ico(self, svg_content: str, output_path: Path, size: int = 256) -> Path:
         """Generate ICO from SVG."""
+        _ensure_raster()
         png_bytes = cairosvg.svg2png(
             bytestring=svg_content.encode("utf-8"),
             output_width=size,
@@ -612,6 +1019,7 @@ class IconGenerator:
         outline_color: Optional[str] = None,
         animation: Optional[Union[str, dict]] = None,
     ) -> Optional[Path]:
+        size_requested = size is not None
         size = size or 256
         is_raster_source = False
         
@@ -667,7 +1075,7 @@ class IconGenerator:
 
         elif icon_name:
             fetch_color = "black" if isinstance(color, tuple) else (color or "currentColor")
-            svg_content = self.get_icon_svg(icon_name, fetch_color)
+            svg_content = self.get_icon_svg(icon_name, fetch_color, size=size)
 
         else:
             print("Error: Must provide icon_name, direct_url, or local_file")
@@ -680,14 +1088,37 @@ class IconGenerator:
         # For raster sources, only apply scale if no background (color already applied during load)
         # For vector sources, apply color, size, and scale if no background
         if not is_raster_source:
-            svg_content = self.modify_svg(
-                svg_content,
-                color,
-                size,
-                preserve_animations=True,
-                direction=direction,
-                scale=effective_scale if not has_background else None,
-            )
+            modify_scale = effective_scale if not has_background else None
+
+            # With no color, size, or scale requested there is nothing to
+            # rewrite — skip the XML round-trip entirely. Only Iconify
+            # fetches qualify: the API already stamped the default
+            # dimensions server-side, whereas URL/local sources still need
+            # modify_svg to apply the 256 default.
+            if color is not None or size_requested or modify_scale not in (None, 1.0) or not icon_name:
+                # Iconify responses have a known simple shape; try the regex fast
+                # path first and only fall back to the full XML round-trip when
+                # the content turns out to be more complex.
+                modified = None
+                if icon_name and not isinstance(color, tuple) and modify_scale in (None, 1.0):
+                    # The ?color= query already recolored the icon server-side in
+                    # most cases, leaving only the size attributes to touch.
+                    modify_color = color
+                    if color and _svg_already_colored(svg_content, color):
+                        modify_color = None
+                    modified = self.modify_svg_fast(svg_content, modify_color, size)
+
+                if modified is not None:
+                    svg_content = modified
+                else:
+                    svg_content = self.modify_svg(
+                        svg_content,
+                        color,
+                        size,
+                        preserve_animations=True,
+                        direction=direction,
+                        scale=modify_scale,
+                    )
         elif not has_background and effective_scale != 1.0:
             # For raster sources without background, apply scale transformation
             svg_content = self.modify_svg(
@@ -702,7 +1133,8 @@ class IconGenerator:
         # Apply animation presets (SVG-native) if requested for all sources
         if animation:
             try:
-                svg_content = Animator().apply(svg_content, animation)
+                from .animation import default_animator
+                svg_content = default_animator.apply(svg_content, animation)
             except Exception as e:
                 print(f"Warning: failed to apply animation: {e}")
 
@@ -739,31 +1171,67 @@ class IconGenerator:
             return self.generate_ico(svg_content, output_path, size)
 
         elif format in ("png", "webp", "jpg", "jpeg"):
-            if not RASTER_AVAILABLE:
+            if not _ensure_raster():
                 print("Error: PIL/cairosvg not available. Cannot generate raster formats.")
                 return None
-            
-            # Convert SVG to PNG bytes
-            png_bytes = cairosvg.svg2png(
-                bytestring=svg_content.encode('utf-8'), 
-                output_width=size, 
-                output_height=size
-            )
-            
+
+            # Raster-in, raster-out fast path: with no background, scale or
+            # animation the SVG is just our own base64 <image> wrapper, so
+            # decode it back instead of paying for a cairo render that
+            # reproduces the same pixels.
+            if is_raster_source and not has_background and effective_scale == 1.0 and animation is None:
+                match = _RASTER_HREF_RE.search(svg_content)
+                if match:
+                    from base64 import b64decode
+                    img = Image.open(BytesIO(b64decode(match.group(1)))).convert("RGBA")
+                    if img.size != (size, size):
+                        # Mirror cairo's default xMidYMid meet: fit uniformly
+                        # and center on a transparent square canvas.
+                        ratio = min(size / img.width, size / img.height)
+                        new_w = max(1, int(round(img.width * ratio)))
+                        new_h = max(1, int(round(img.height * ratio)))
+                        if (new_w, new_h) != img.size:
+                            img = img.resize((new_w, new_h), Image.Resampling.LANCZOS, reducing_gap=3.0)
+                        canvas = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+                        canvas.paste(img, ((size - new_w) // 2, (size - new_h) // 2))
+                        img = canvas
+                    self._ensure_parent(output_path)
+                    if format in ("jpg", "jpeg"):
+                        background = Image.new("RGBA", img.size, (255, 255, 255, 255))
+                        background.alpha_composite(img)
+                        background.convert("RGB").save(output_path, format='JPEG', quality=95)
+                    elif format == "webp":
+                        img.save(output_path, format='WEBP', quality=95)
+                    else:
+                        img.save(output_path, format='PNG')
+                    img.close()
+                    return output_path
+
+            # Rasterize lazily per branch: the PNG branch writes the bytes
+            # untouched, and a successful animated-webp export never needs
+            # the single-frame render at all
+            def render_png() -> bytes:
+                return cairosvg.svg2png(
+                    bytestring=svg_content.encode('utf-8'),
+                    output_width=size,
+                    output_height=size
+                )
+
             if format == "png":
-                output_path.parent.mkdir(parents=True, exist_ok=True)
+                self._ensure_parent(output_path)
                 with open(output_path, 'wb') as f:
-                    f.write(png_bytes)
+                    f.write(render_png())
                 return output_path
             # Handle other raster formats
             if format in ("jpg", "jpeg"):
-                image = Image.open(BytesIO(png_bytes))
-                # Convert RGBA to RGB for JPEG (no transparency support)
+                image = Image.open(BytesIO(render_png()))
+                # Convert RGBA to RGB for JPEG (no transparency support):
+                # composite over white in one C pass instead of paste+mask
                 if image.mode == "RGBA":
-                    rgb_image = Image.new("RGB", image.size, (255, 255, 255))
-                    rgb_image.paste(image, mask=image.split()[3])  # Use alpha as mask
-                    image = rgb_image
-                output_path.parent.mkdir(parents=True, exist_ok=True)
+                    background = Image.new("RGBA", image.size, (255, 255, 255, 255))
+                    background.alpha_composite(image)
+                    image = background.convert("RGB")
+                self._ensure_parent(output_path)
                 image.save(output_path, format='JPEG', quality=95)
                 image.close()
                 return output_path
@@ -772,7 +1240,7 @@ class IconGenerator:
                 # If an SVG-native animation was requested and source is vector,
                 # rasterize multiple frames and save an animated WebP.
                 if animation and not is_raster_source:
-                    output_path.parent.mkdir(parents=True, exist_ok=True)
+                    self._ensure_parent(output_path)
                     # Rasterize frames from the pre-wrap (icon-only) SVG and
                     # let the exporter composite the background so transforms
                     # and centering are handled consistently.
@@ -782,7 +1250,8 @@ class IconGenerator:
                     # so pass scale=1.0 to avoid double-scaling. If there's a background,
                     # wrap_with_background will handle it, so pass effective_scale.
                     webp_scale = 1.0 if not has_background else effective_scale
-                    
+
+                    from .animation.webp_exporter import svg_animation_to_webp
                     result = svg_animation_to_webp(
                         src_svg_for_export,
                         output_path,
@@ -803,8 +1272,8 @@ class IconGenerator:
                     # fall through to static webp saving on failure
 
                 # Fallback: static webp from single-frame PNG
-                image = Image.open(BytesIO(png_bytes))
-                output_path.parent.mkdir(parents=True, exist_ok=True)
+                image = Image.open(BytesIO(render_png()))
+                self._ensure_parent(output_path)
                 image.save(output_path, format='WEBP', quality=95)
                 image.close()
                 return output_path
@@ -826,17 +1295,105 @@ class IconGenerator:
         outline_width: int = 0,
         outline_color: Optional[str] = None,
         animation: Optional[Union[str, dict]] = None,
+        max_workers: Optional[int] = None,
+        verbose: bool = True,
     ) -> list[Path]:
-        """Generate multiple icons at once."""
-        results: list[Path] = []
+        """Generate multiple icons at once.
+
+        Icons are independent, so batches of 3+ run on a thread pool
+        (network fetches overlap and the SVG/file work releases the GIL
+        around I/O). `max_workers` caps the pool; batches of 1-2 icons run
+        serially since pool setup would dominate. `verbose=False` silences
+        the per-icon progress line, whose stdout flushes interleave and
+        serialize under the pool.
+        """
+        defaults = dict(
+            size=size,
+            scale=scale,
+            color=color,
+            direction=direction,
+            bg_color=bg_color,
+            bg_direction=bg_direction,
+            border_radius=border_radius,
+            outline_width=outline_width,
+            outline_color=outline_color,
+            animation=animation,
+        )
 
-        for output_name, icon_config in icons.items():
-            print(f"\nGenerating {output_name}...")
+        def generate_one(output_name, icon_config):
+            if verbose:
+                print(f"\nGenerating {output_name}...")
+            return self._generate_from_config(output_name, icon_config, **defaults)
 
-            if isinstance(icon_config, str):
-                path = self.generate_icon(
-                    icon_name=icon_config,
-                    output_name=output_name,
+        workers = max_workers or min(8, len(icons) or 1)
+        if workers > 1 and len(icons) >= 3:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                paths = list(executor.map(generate_one, icons.keys(), icons.values()))
+        else:
+            paths = [generate_one(name, config) for name, config in icons.items()]
+
+        return [path for path in paths if path]
+
+    def _generate_from_config(
+        self,
+        output_name: str,
+        icon_config,
+        **defaults,
+    ) -> Optional[Path]:
+        """Resolve a single batch entry (icon name string or config dict) and generate it."""
+        if isinstance(icon_config, str):
+            return self.generate_icon(
+                icon_name=icon_config,
+                output_name=output_name,
+                **defaults,
+            )
+
+        if isinstance(icon_config, dict):
+            # One C-level dict merge instead of a .get() chain per option;
+            # unknown keys are filtered so configs stay forward-compatible.
+            overrides = {k: v for k, v in icon_config.items() if k in _BATCH_CONFIG_KEYS}
+            return self.generate_icon(
+                icon_name=icon_config.get("icon"),
+                direct_url=icon_config.get("url"),
+                local_file=icon_config.get("local_file"),
+                output_name=output_name,
+                **{**defaults, **overrides},
+            )
+
+        print(f"Invalid config for {output_name}")
+        return None
+
+    async def generate_batch_async(
+        self,
+        icons: dict[str, str | dict],
+        size: Optional[int] = None,
+        scale: Optional[float] = None,
+        color: Optional[Union[str, tuple[str, str]]] = None,
+        direction: str = "horizontal",
+        bg_color: Optional[Union[str, tuple[str, str]]] = None,
+        bg_direction: str = "horizontal",
+        border_radius: int = 0,
+        outline_width: int = 0,
+        outline_color: Optional[str] = None,
+        animation: Optional[Union[str, dict]] = None,
+        max_concurrency: int = 8,
+    ) -> list[Path]:
+        """Generate multiple icons concurrently.
+
+        Batch time is dominated by the HTTPS round-trip per icon, so icons
+        are dispatched concurrently (bounded by `max_concurrency`) instead of
+        one at a time. Each icon still runs the normal `generate_icon` path
+        in a worker thread; results keep the order of `icons`.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def generate_one(output_name, icon_config):
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self._generate_from_config,
+                    output_name,
+                    icon_config,
                     size=size,
                     scale=scale,
                     color=color,
@@ -849,29 +1406,16 @@ class IconGenerator:
                     animation=animation,
                 )
 
-            elif isinstance(icon_config, dict):
-                path = self.generate_icon(
-                    icon_name=icon_config.get("icon"),
-                    direct_url=icon_config.get("url"),
-                    local_file=icon_config.get("local_file"),
-                    output_name=output_name,
-                    size=icon_config.get("size", size),
-                    scale=icon_config.get("scale", scale),
-                    color=icon_config.get("color", color),
-                    direction=icon_config.get("direction", direction),
-                    bg_color=icon_config.get("bg_color", bg_color),
-                    bg_direction=icon_config.get("bg_direction", bg_direction),
-                    border_radius=icon_config.get("border_radius", border_radius),
-                    outline_width=icon_config.get("outline_width", outline_width),
-                    outline_color=icon_config.get("outline_color", outline_color),
-                    animation=icon_config.get("animation", animation),
-                )
+        tasks = [
+            generate_one(output_name, icon_config)
+            for output_name, icon_config in icons.items()
+        ]
+        paths = await asyncio.gather(*tasks, return_exceptions=True)
 
-            else:
-                print(f"Invalid config for {output_name}")
-                continue
-
-            if path:
+        results: list[Path] = []
+        for output_name, path in zip(icons, paths):
+            if isinstance(path, Exception):
+                print(f"Error generating {output_name}: {path}")
+            elif path:
                 results.append(path)
-
         return results
\ No newline at end of file
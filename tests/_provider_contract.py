@@ -0,0 +1,84 @@
+"""Shared test scenarios for the chat-completion providers.
+
+Both provider test classes exercise the same discovery scenarios against
+different client targets and payloads. The contract defines each scenario
+once; concrete subclasses supply the provider class, patch target, and
+expected payload details as class attributes, and pytest discovers the
+inherited methods on the subclass.
+"""
+
+import pytest
+from unittest.mock import MagicMock
+
+
+class ProviderContract:
+    """Discovery scenarios common to every chat-completion provider."""
+
+    provider_cls = None
+    patch_module = None
+    patch_attr = ""
+    api_key = "test-key"
+    # Payload and expectations for the success scenario.
+    success_payload = ""
+    success_icon_names = ()
+    success_first_reason = ""
+    # Payload, context dict, and needles for the context scenario.
+    context_payload = ""
+    context = {}
+    context_needles = ()
+
+    def _install_client(self, monkeypatch, mock_client_instance):
+        """Point the provider's client constructor at a stub instance."""
+        monkeypatch.setattr(
+            self.patch_module, self.patch_attr, lambda *args, **kwargs: mock_client_instance
+        )
+
+    def _make_provider(self):
+        return self.provider_cls(api_key=self.api_key)
+
+    def test_discover_icons_success(self, monkeypatch, make_chat_response):
+        """Test successful icon discovery with JSON response."""
+        mock_client_instance = MagicMock()
+        mock_client_instance.chat.completions.create.return_value = make_chat_response(
+            self.success_payload
+        )
+        self._install_client(monkeypatch, mock_client_instance)
+
+        result = self._make_provider().query(
+            "icon request", system_prompt="You are an icon search assistant"
+        )
+
+        assert len(result.suggestions) == len(self.success_icon_names)
+        assert [s.icon_name for s in result.suggestions] == list(self.success_icon_names)
+        assert result.suggestions[0].reason == self.success_first_reason
+
+    def test_discover_icons_with_context(
+        self, monkeypatch, make_chat_response, assert_user_message_contains
+    ):
+        """Test icon discovery with additional context."""
+        mock_client_instance = MagicMock()
+        mock_client_instance.chat.completions.create.return_value = make_chat_response(
+            self.context_payload
+        )
+        self._install_client(monkeypatch, mock_client_instance)
+
+        result = self._make_provider().query(
+            "icon request", context=self.context, system_prompt="You are an icon search assistant"
+        )
+
+        assert len(result.suggestions) == 1
+        # Verify context was passed in the API call
+        assert_user_message_contains(
+            mock_client_instance.chat.completions.create, *self.context_needles
+        )
+
+    def test_discover_icons_api_error(self, monkeypatch):
+        """Test handling of API errors."""
+        mock_client_instance = MagicMock()
+        mock_client_instance.chat.completions.create.side_effect = Exception("API Error")
+        self._install_client(monkeypatch, mock_client_instance)
+
+        provider = self._make_provider()
+
+        with pytest.raises(Exception):
+            provider.query("test icon", system_prompt="You are an icon search assistant")
@@ -0,0 +1,89 @@
+"""Shared fixtures for the provider test modules."""
+
+import re
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+import pytest
+
+
+@lru_cache(maxsize=32)
+def _needles_pattern(needles):
+    """One lookahead per needle, compiled once per distinct needle set."""
+    return re.compile("".join(f"(?=.*{re.escape(n)})" for n in needles), re.S)
+
+
+@dataclass(slots=True)
+class _Msg:
+    content: str
+
+
+@dataclass(slots=True)
+class _Choice:
+    message: _Msg
+
+
+@dataclass(slots=True)
+class _Usage:
+    total_tokens: int = 100
+
+
+@dataclass(slots=True)
+class FakeChatResponse:
+    """Fixed-shape chat-completion response: attribute reads only, no mock
+    bookkeeping, and slots instead of per-instance dicts."""
+
+    choices: list
+    usage: _Usage = field(default_factory=_Usage)
+
+
+@pytest.fixture(autouse=True)
+def _reset_provider_caches():
+    """Drop provider-level client caches after each test.
+
+    The HuggingFace provider memoizes constructed clients; clearing the
+    cache between tests guarantees a stale (possibly stubbed) client from
+    one test can never be handed to the next. Lazy sys.modules lookup so
+    non-provider tests don't pay for the ai imports.
+    """
+    yield
+    hfp = sys.modules.get("icon_gen_ai.ai.huggingface_provider")
+    if hfp is not None:
+        hfp._CLIENT_CACHE.clear()
+
+
+@pytest.fixture
+def make_chat_response():
+    """Factory for chat-completion response stubs.
+
+    Builds only the attribute tree the providers actually read
+    (``.choices[0].message.content`` and ``.usage.total_tokens``), so tests
+    skip the per-attribute MagicMock churn of wiring the same chain by hand.
+    """
+    def _make(content, total_tokens=100):
+        return FakeChatResponse(
+            choices=[_Choice(_Msg(content))],
+            usage=_Usage(total_tokens),
+        )
+
+    return _make
+
+
+@pytest.fixture
+def assert_user_message_contains():
+    """Assert the recorded chat call's user message contains every needle.
+
+    Extracts the user message from a mocked ``chat.completions.create``
+    once and checks all needles in a single pass of a cached compiled
+    regex, replacing the generator-plus-substring checks each context
+    test rebuilt inline. Failures still report every missing needle.
+    """
+    def _assert(create_call, *needles):
+        messages = create_call.call_args[1]["messages"]
+        user = next(m["content"] for m in messages if m["role"] == "user")
+        if not _needles_pattern(needles).search(user):
+            missing = [n for n in needles if n not in user]
+            pytest.fail(f"missing {missing} in {user!r}")
+
+    return _assert
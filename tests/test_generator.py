@@ -71,8 +71,25 @@ def test_wrap_with_background():
     
     svg = '<svg viewBox="0 0 24 24"><path d="M0 0h24v24H0z"/></svg>'
     wrapped = generator.wrap_with_background(svg, 256, bg_color='#FF0000', border_radius=20)
-    
+
     assert 'width="256"' in wrapped
     assert 'height="256"' in wrapped
     assert '#FF0000' in wrapped
     assert 'rx="20"' in wrapped
+
+
+def test_wrap_with_background_namespaced_svg_parses():
+    """Wrapped output stays valid XML for namespaced (real-world) icons."""
+    from xml.etree import ElementTree as ET
+    from icon_gen_ai.generator import IconGenerator
+    generator = IconGenerator()
+
+    svg = (
+        '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24">'
+        '<path d="M0 0h24v24H0z"/></svg>'
+    )
+    wrapped = generator.wrap_with_background(svg, 64, bg_color='blue')
+
+    # Raises on unbound prefixes if the children lost their namespace binding
+    ET.fromstring(wrapped)
+    assert 'ns0:' not in wrapped
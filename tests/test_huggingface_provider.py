@@ -1,163 +1,87 @@
 """Tests for Hugging Face provider with mocked API calls."""
 
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock
+from icon_gen_ai.ai import huggingface_provider as hfp
 from icon_gen_ai.ai.huggingface_provider import HuggingFaceProvider
 from icon_gen_ai.ai.base import IconSuggestion
+from tests._provider_contract import ProviderContract
 
 
-class TestHuggingFaceProvider:
-    """Test Hugging Face provider functionality with mocked API."""
+def _install_client(monkeypatch, mock_client_instance):
+    """Point the provider module's InferenceClient at a stub constructor."""
+    monkeypatch.setattr(hfp, "InferenceClient", lambda *args, **kwargs: mock_client_instance)
 
-    def test_initialization_with_token(self):
-        """Test provider initialization with HF token."""
-        provider = HuggingFaceProvider(api_key="test-token")
-        assert provider.api_key == "test-token"
-        assert provider.model == "deepseek-ai/DeepSeek-V3.1"
-
-    def test_initialization_custom_model(self):
-        """Test provider initialization with custom model."""
-        provider = HuggingFaceProvider(
-            api_key="test-token",
-            model="meta-llama/Llama-3.3-70B-Instruct"
-        )
-        assert provider.model == "meta-llama/Llama-3.3-70B-Instruct"
-
-    def test_provider_name(self):
-        """Test provider name method."""
-        provider = HuggingFaceProvider(api_key="test-token")
-        assert provider.get_provider_name() == "huggingface"
-
-    @patch('icon_gen_ai.ai.huggingface_provider.InferenceClient')
-    def test_discover_icons_success(self, mock_hf_client):
-        """Test successful icon discovery with JSON response."""
-        # Mock the API response
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = '''{
-            "suggestions": [
-                {
-                    "icon_name": "mdi:database",
-                    "reason": "Database icon"
-                },
-                {
-                    "icon_name": "heroicons:database",
-                    "reason": "Modern database icon"
-                }
-            ]
-        }'''
-        mock_response.usage = MagicMock()
-        mock_response.usage.total_tokens = 100
-        
-        mock_client_instance = MagicMock()
-        mock_client_instance.chat.completions.create.return_value = mock_response
-        mock_hf_client.return_value = mock_client_instance
-        
-        provider = HuggingFaceProvider(api_key="test-token")
-        result = provider.query("database icon", system_prompt="You are an icon search assistant")
-        
-        assert len(result.suggestions) == 2
-        assert result.suggestions[0].icon_name == "mdi:database"
-        assert result.suggestions[0].reason == "Database icon"
-        assert result.suggestions[1].icon_name == "heroicons:database"
-
-    @patch('icon_gen_ai.ai.huggingface_provider.InferenceClient')
-    def test_discover_icons_with_context(self, mock_hf_client):
-        """Test icon discovery with additional context."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = '''{
-            "suggestions": [{"icon_name": "mdi:cloud", "reason": "Cloud storage"}]
-        }'''
-        mock_response.usage = MagicMock()
-        mock_response.usage.total_tokens = 100
-        
-        mock_client_instance = MagicMock()
-        mock_client_instance.chat.completions.create.return_value = mock_response
-        mock_hf_client.return_value = mock_client_instance
-        
-        provider = HuggingFaceProvider(api_key="test-token")
-        context = {"design_style": "minimal", "project_type": "cloud"}
-        result = provider.query("storage", context=context, system_prompt="You are an icon search assistant")
-        
-        assert len(result.suggestions) == 1
-        # Verify context was passed in the API call
-        call_args = mock_client_instance.chat.completions.create.call_args
-        messages = call_args[1]['messages']
-        user_message = next(m['content'] for m in messages if m['role'] == 'user')
-        assert 'minimal' in user_message
-        assert 'cloud' in user_message
 
-    @patch('icon_gen_ai.ai.huggingface_provider.InferenceClient')
-    def test_discover_icons_text_fallback(self, mock_hf_client):
+# Canonical response payloads, built once per module instead of re-stated
+# inside each test body.
+_JSON_TWO_SUGGESTIONS = '''{
+    "suggestions": [
+        {
+            "icon_name": "mdi:database",
+            "reason": "Database icon"
+        },
+        {
+            "icon_name": "heroicons:database",
+            "reason": "Modern database icon"
+        }
+    ]
+}'''
+_JSON_ONE_SUGGESTION = '''{
+    "suggestions": [{"icon_name": "mdi:cloud", "reason": "Cloud storage"}]
+}'''
+_JSON_EMPTY = '{"suggestions": []}'
+_TEXT_RESPONSE = '''
+Icon suggestions:
+1. mdi:code - Code icon
+2. devicon:python - Python icon
+'''
+
+
+class TestHuggingFaceProvider(ProviderContract):
+    """Test Hugging Face provider functionality with mocked API.
+
+    The shared discovery scenarios come from ProviderContract; only the
+    behaviors specific to this provider are spelled out below.
+    """
+
+    provider_cls = HuggingFaceProvider
+    patch_module = hfp
+    patch_attr = "InferenceClient"
+    api_key = "test-token"
+    success_payload = _JSON_TWO_SUGGESTIONS
+    success_icon_names = ("mdi:database", "heroicons:database")
+    success_first_reason = "Database icon"
+    context_payload = _JSON_ONE_SUGGESTION
+    context = {"design_style": "minimal", "project_type": "cloud"}
+    context_needles = ("minimal", "cloud")
+
+    def test_discover_icons_text_fallback(self, monkeypatch, make_chat_response):
         """Test fallback to text parsing when JSON fails."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
         # Return non-JSON response that will cause an error
-        mock_response.choices[0].message.content = '''
-        Icon suggestions:
-        1. mdi:code - Code icon
-        2. devicon:python - Python icon
-        '''
-        mock_response.usage = MagicMock()
-        mock_response.usage.total_tokens = 100
-        
+        mock_response = make_chat_response(_TEXT_RESPONSE)
+
         mock_client_instance = MagicMock()
         mock_client_instance.chat.completions.create.return_value = mock_response
-        mock_hf_client.return_value = mock_client_instance
-        
+        _install_client(monkeypatch, mock_client_instance)
+
         provider = HuggingFaceProvider(api_key="test-token")
-        
+
         # Non-JSON responses should raise an exception
         with pytest.raises(Exception):
             provider.query("python icon", system_prompt="You are an icon search assistant")
 
-    @patch('icon_gen_ai.ai.huggingface_provider.InferenceClient')
-    def test_discover_icons_api_error(self, mock_hf_client):
-        """Test handling of API errors."""
-        mock_client_instance = MagicMock()
-        mock_client_instance.chat.completions.create.side_effect = Exception("API Error")
-        mock_hf_client.return_value = mock_client_instance
-        
-        provider = HuggingFaceProvider(api_key="test-token")
-        
-        with pytest.raises(Exception):
-            provider.query("test icon", system_prompt="You are an icon search assistant")
-
-    @patch('icon_gen_ai.ai.huggingface_provider.InferenceClient')
-    def test_discover_icons_empty_response(self, mock_hf_client):
-        """Test handling of empty API response."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = '{"suggestions": []}'
-        mock_response.usage = MagicMock()
-        mock_response.usage.total_tokens = 100
-        
-        mock_client_instance = MagicMock()
-        mock_client_instance.chat.completions.create.return_value = mock_response
-        mock_hf_client.return_value = mock_client_instance
-        
-        provider = HuggingFaceProvider(api_key="test-token")
-        result = provider.query("nonexistent icon", system_prompt="You are an icon search assistant")
-        
-        assert len(result.suggestions) == 0
-
-    @patch('icon_gen_ai.ai.huggingface_provider.InferenceClient')
-    def test_discover_icons_with_max_tokens(self, mock_hf_client):
+    def test_discover_icons_with_max_tokens(self, monkeypatch, make_chat_response):
         """Test API call includes max_tokens parameter."""
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = '{"suggestions": []}'
-        mock_response.usage = MagicMock()
-        mock_response.usage.total_tokens = 100
-        
+        mock_response = make_chat_response(_JSON_EMPTY)
+
         mock_client_instance = MagicMock()
         mock_client_instance.chat.completions.create.return_value = mock_response
-        mock_hf_client.return_value = mock_client_instance
-        
+        _install_client(monkeypatch, mock_client_instance)
+
         provider = HuggingFaceProvider(api_key="test-token")
         provider.query("test", system_prompt="You are an icon search assistant")
-        
+
         # Verify max_tokens was passed (HuggingFace uses 10000 tokens)
         call_args = mock_client_instance.chat.completions.create.call_args
         assert 'max_tokens' in call_args[1]
@@ -0,0 +1,72 @@
+"""Parametrized tests shared by the chat-completion providers.
+
+The HuggingFace and OpenAI providers expose the same construction and
+empty-response behavior; one parametrized function per scenario replaces
+the near-identical copies that lived in each provider's test module.
+"""
+
+import pytest
+from unittest.mock import MagicMock
+
+import openai
+
+from icon_gen_ai.ai import huggingface_provider as hfp
+from icon_gen_ai.ai.huggingface_provider import HuggingFaceProvider
+from icon_gen_ai.ai.openai_provider import OpenAIProvider
+
+# Patch targets are (module object, attribute) pairs so setattr holds a
+# direct module reference instead of re-resolving a dotted string per test.
+_PROVIDERS = [
+    pytest.param(
+        HuggingFaceProvider,
+        "deepseek-ai/DeepSeek-V3.1",
+        "meta-llama/Llama-3.3-70B-Instruct",
+        "huggingface",
+        (hfp, "InferenceClient"),
+        id="huggingface",
+    ),
+    pytest.param(
+        OpenAIProvider,
+        "gpt-4o-mini",
+        "gpt-3.5-turbo",
+        "openai",
+        (openai, "OpenAI"),
+        id="openai",
+    ),
+]
+
+_PARAMS = "cls, default_model, custom_model, name, patch_target"
+
+_JSON_EMPTY = '{"suggestions": []}'
+
+
+@pytest.mark.parametrize(_PARAMS, _PROVIDERS)
+def test_default_init(cls, default_model, custom_model, name, patch_target):
+    """Providers keep the api key, default model, and report their name."""
+    provider = cls(api_key="test-key")
+    assert provider.api_key == "test-key"
+    assert provider.model == default_model
+    assert provider.get_provider_name() == name
+
+
+@pytest.mark.parametrize(_PARAMS, _PROVIDERS)
+def test_custom_model(cls, default_model, custom_model, name, patch_target):
+    """A caller-supplied model overrides the default."""
+    provider = cls(api_key="test-key", model=custom_model)
+    assert provider.model == custom_model
+
+
+@pytest.mark.parametrize(_PARAMS, _PROVIDERS)
+def test_discover_icons_empty_response(
+    cls, default_model, custom_model, name, patch_target, monkeypatch, make_chat_response
+):
+    """An empty suggestions payload yields an empty result, not an error."""
+    mock_client_instance = MagicMock()
+    mock_client_instance.chat.completions.create.return_value = make_chat_response(_JSON_EMPTY)
+    module, attr = patch_target
+    monkeypatch.setattr(module, attr, lambda *args, **kwargs: mock_client_instance)
+
+    provider = cls(api_key="test-key")
+    result = provider.query("nonexistent icon", system_prompt="You are an icon search assistant")
+
+    assert len(result.suggestions) == 0